@@ -1,6 +1,16 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
+import base64
+import binascii
+import hashlib
+import hmac
+import threading
+import time
+import orjson
+from cachetools import TTLCache
 from jose import JWTError, jwt
+from jose.exceptions import ExpiredSignatureError
 from src.shared.domain.exceptions import UnauthorizedError
 from src.contexts.users.domain.services import PasswordService
 from src.contexts.users.domain.repositories import UserRepository
@@ -8,21 +18,166 @@ from src.shared.infrastructure.metrics import record_auth_attempt, record_jwt_to
 import os
 
 
-class AuthService:
+# JWT configuration, read once at import time
+_SECRET_KEY = os.getenv("SECRET_KEY")
+_ALGORITHM = os.getenv("ALGORITHM", "HS256")
+_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+_EXPIRE_SECONDS = _EXPIRE_MINUTES * 60
+
+# Verified token payloads, keyed by a fixed-size digest of the raw token
+_token_cache: TTLCache = TTLCache(
+    maxsize=int(os.getenv("TOKEN_CACHE_SIZE", "10000")),
+    ttl=int(os.getenv("TOKEN_CACHE_TTL_SECONDS", "60"))
+)
+_token_cache_lock = threading.Lock()
+
+
+# HMAC algorithms that can be verified without going through jwt.decode
+_HMAC_DIGESTS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+# Claims set on the tokens issued by this service
+_ISSUED_CLAIMS = frozenset({"sub", "email", "exp"})
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Get the cache key for a raw token."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _b64url_encode(data: bytes) -> str:
+    """Encode bytes as unpadded Base64URL."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64url_decode(data: str) -> bytes:
+    """Decode unpadded Base64URL."""
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+# Header of the tokens this service issues, as jose serializes it
+_HMAC_DIGEST = _HMAC_DIGESTS.get(_ALGORITHM)
+_EXPECTED_HEADER = _b64url_encode(
+    orjson.dumps({"alg": _ALGORITHM, "typ": "JWT"}, option=orjson.OPT_SORT_KEYS)
+)
+
+
+@lru_cache(maxsize=8)
+def _mac_prototype(secret_key: str, algorithm: str) -> "hmac.HMAC":
+    """Get a keyed HMAC to copy from, so the key schedule runs only once."""
+    return hmac.new(secret_key.encode(), digestmod=_HMAC_DIGESTS[algorithm])
+
+
+def _sign(signing_input: str) -> bytes:
+    """Sign a JWT signing input with the configured HMAC key."""
+    mac = _mac_prototype(_SECRET_KEY, _ALGORITHM).copy()
+    mac.update(signing_input.encode())
+    return mac.digest()
+
+
+class TokenVerifier:
+    """Verifies the access tokens AuthService issues.
+    
+    Needs only the signing key, so one instance can be shared by every
+    authenticated request without a repository or database session.
+    """
+    
+    def verify_token(self, token: str) -> dict:
+        """Verify and decode JWT token."""
+        cache_key = _token_cache_key(token)
+        with _token_cache_lock:
+            payload = _token_cache.get(cache_key)
+        
+        if payload is not None:
+            if payload["exp"] > time.time():
+                return payload
+            # Token expired while cached, evict it and let jwt.decode reject it
+            with _token_cache_lock:
+                _token_cache.pop(cache_key, None)
+        
+        try:
+            payload = self._decode_token(token)
+            user_id: str = payload.get("sub")
+            if user_id is None:
+                raise UnauthorizedError("Invalid token")
+        except JWTError:
+            raise UnauthorizedError("Invalid token")
+        
+        if "exp" in payload:
+            with _token_cache_lock:
+                _token_cache[cache_key] = payload
+        return payload
+    
+    def invalidate_token(self, token: str) -> None:
+        """Drop a token from the verification cache (e.g. on logout)."""
+        with _token_cache_lock:
+            _token_cache.pop(_token_cache_key(token), None)
+    
+    def _decode_token(self, token: str) -> dict:
+        """Decode a JWT token, raising JWTError if it is not valid."""
+        payload = self._fast_verify(token)
+        if payload is None:
+            payload = jwt.decode(token, _SECRET_KEY, algorithms=[_ALGORITHM])
+        return payload
+    
+    def _fast_verify(self, token: str) -> Optional[dict]:
+        """Verify a token issued by this service without a full jwt.decode.
+        
+        Returns None when the token does not have the exact header and claims
+        this service issues, so it has to go through jwt.decode instead.
+        """
+        if _HMAC_DIGEST is None:
+            return None
+        
+        try:
+            header_b64, rest = token.split(".", 1)
+            payload_b64, signature_b64 = rest.rsplit(".", 1)
+        except ValueError:
+            raise JWTError("Not enough segments")
+        
+        if header_b64 != _EXPECTED_HEADER:
+            return None
+        
+        try:
+            signature = _b64url_decode(signature_b64)
+        except (binascii.Error, ValueError):
+            raise JWTError("Invalid signature padding")
+        
+        expected_signature = _sign(f"{header_b64}.{payload_b64}")
+        if not hmac.compare_digest(expected_signature, signature):
+            raise JWTError("Signature verification failed")
+        
+        try:
+            payload = orjson.loads(_b64url_decode(payload_b64))
+        except (binascii.Error, ValueError):
+            raise JWTError("Invalid payload string")
+        
+        if not isinstance(payload, dict) or payload.keys() != _ISSUED_CLAIMS:
+            return None
+        if not isinstance(payload["exp"], int) or not isinstance(payload["sub"], str):
+            return None
+        if payload["exp"] < int(time.time()):
+            raise ExpiredSignatureError("Signature has expired")
+        
+        return payload
+
+
+class AuthService(TokenVerifier):
     """Domain service for authentication operations."""
     
     def __init__(self, user_repository: UserRepository, password_service: PasswordService):
         self.user_repository = user_repository
         self.password_service = password_service
-        self.secret_key = os.getenv("SECRET_KEY")
-        self.algorithm = os.getenv("ALGORITHM", "HS256")
-        self.access_token_expire_minutes = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES"))
     
     async def authenticate_user(self, email: str, password: str) -> dict:
         """Authenticate a user with email and password."""
         try:
             user = await self.user_repository.find_by_email(email)
             if not user:
+                await self.password_service.dummy_verify_async()
                 record_auth_attempt("invalid_credentials")
                 raise UnauthorizedError("Invalid email or password")
             
@@ -30,24 +185,19 @@ class AuthService:
                 record_auth_attempt("inactive_account")
                 raise UnauthorizedError("User account is inactive")
             
-            if not self.password_service.verify_password(password, user.hashed_password.hashed_value):
+            # bcrypt is slow by design, keep it off the event loop
+            if not await self.password_service.verify_password_async(password, user.hashed_password.hashed_value):
                 record_auth_attempt("invalid_password")
                 raise UnauthorizedError("Invalid email or password")
             
             # Create access token
-            access_token = self._create_access_token({"sub": user.id, "email": user.email.value})
+            token = self._issue_token(user.id, user.email.value)
             
             # Record successful authentication and token issuance
             record_auth_attempt("success")
             record_jwt_token_issued()
             
-            return {
-                "access_token": access_token,
-                "token_type": "bearer",
-                "user_id": user.id,
-                "email": user.email.value,
-                "expires_at": datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes)
-            }
+            return token
         except UnauthorizedError:
             # Re-raise UnauthorizedError without additional logging
             raise
@@ -55,21 +205,10 @@ class AuthService:
             record_auth_attempt("error")
             raise
     
-    def verify_token(self, token: str) -> dict:
-        """Verify and decode JWT token."""
-        try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            user_id: str = payload.get("sub")
-            if user_id is None:
-                raise UnauthorizedError("Invalid token")
-            return payload
-        except JWTError:
-            raise UnauthorizedError("Invalid token")
-    
     def refresh_access_token(self, token: str) -> dict:
         """Refresh an access token."""
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            payload = self._decode_token(token)
             user_id: str = payload.get("sub")
             email: str = payload.get("email")
             
@@ -77,26 +216,35 @@ class AuthService:
                 raise UnauthorizedError("Invalid token")
             
             # Create new access token
-            new_access_token = self._create_access_token({"sub": user_id, "email": email})
-            
-            return {
-                "access_token": new_access_token,
-                "token_type": "bearer",
-                "user_id": user_id,
-                "email": email,
-                "expires_at": datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes)
-            }
+            return self._issue_token(user_id, email)
         except JWTError:
             raise UnauthorizedError("Invalid or expired token")
-
+    
+    def _issue_token(self, user_id: str, email: str) -> dict:
+        """Issue an access token and describe it for the token response."""
+        exp = int(time.time()) + _EXPIRE_SECONDS
+        return {
+            "access_token": self._encode_token({"sub": user_id, "email": email}, exp),
+            "token_type": "bearer",
+            "user_id": user_id,
+            "email": email,
+            "expires_at": datetime.fromtimestamp(exp, tz=timezone.utc)
+        }
+    
     def _create_access_token(self, data: dict, expires_delta: Optional[timedelta] = None):
         """Create JWT access token."""
+        lifetime = int(expires_delta.total_seconds()) if expires_delta is not None else _EXPIRE_SECONDS
+        return self._encode_token(data, int(time.time()) + lifetime)
+    
+    def _encode_token(self, data: dict, exp: int) -> str:
+        """Encode claims into a JWT expiring at the given Unix timestamp."""
         to_encode = data.copy()
-        if expires_delta:
-            expire = datetime.utcnow() + expires_delta
-        else:
-            expire = datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes)
+        to_encode["exp"] = exp
+        if _HMAC_DIGEST is None:
+            return jwt.encode(to_encode, _SECRET_KEY, algorithm=_ALGORITHM)
         
-        to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
-        return encoded_jwt 
\ No newline at end of file
+        # Only the payload changes between tokens, the header is precomputed
+        # and the HMAC key schedule is reused
+        payload_b64 = _b64url_encode(orjson.dumps(to_encode, option=orjson.OPT_SORT_KEYS))
+        signing_input = f"{_EXPECTED_HEADER}.{payload_b64}"
+        return f"{signing_input}.{_b64url_encode(_sign(signing_input))}" 
\ No newline at end of file
@@ -1,23 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.shared.infrastructure.database import get_db
-from src.shared.domain.exceptions import UnauthorizedError
 from src.contexts.auth.application.dtos import LoginDto, TokenDto
 from src.contexts.auth.domain.services import AuthService
 from src.contexts.users.infrastructure.repositories import SQLAlchemyUserRepository
 from src.contexts.users.domain.services import PasswordService
 
 
-router = APIRouter(prefix="/auth", tags=["authentication"])
+router = APIRouter(prefix="/auth", tags=["authentication"], default_response_class=ORJSONResponse)
 security = HTTPBearer()
 
+# Stateless, so a single instance is shared across requests
+_PASSWORD_SERVICE = PasswordService()
 
-def get_auth_service(db: Session = Depends(get_db)) -> AuthService:
+
+def get_auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
     """Get authentication service instance."""
     user_repository = SQLAlchemyUserRepository(db)
-    password_service = PasswordService()
-    return AuthService(user_repository, password_service)
+    return AuthService(user_repository, _PASSWORD_SERVICE)
 
 
 @router.post("/login", response_model=TokenDto)
@@ -26,15 +28,9 @@ async def login(
     auth_service: AuthService = Depends(get_auth_service)
 ):
     """Authenticate user and return access token."""
-    try:
-        result = await auth_service.authenticate_user(login_data.email, login_data.password)
-        return TokenDto(**result)
-    except UnauthorizedError as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e),
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    result = await auth_service.authenticate_user(login_data.email, login_data.password)
+    # The token dict is built by AuthService with TokenDto's fields, skip revalidating it
+    return ORJSONResponse(result)
 
 
 @router.post("/verify")
@@ -43,15 +39,8 @@ async def verify_token(
     auth_service: AuthService = Depends(get_auth_service)
 ):
     """Verify JWT token."""
-    try:
-        payload = auth_service.verify_token(credentials.credentials)
-        return {"valid": True, "user_id": payload.get("sub"), "email": payload.get("email")}
-    except UnauthorizedError as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e),
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    payload = auth_service.verify_token(credentials.credentials)
+    return {"valid": True, "user_id": payload.get("sub"), "email": payload.get("email")}
 
 
 @router.post("/refresh", response_model=TokenDto)
@@ -60,12 +49,6 @@ async def refresh_token(
     auth_service: AuthService = Depends(get_auth_service)
 ):
     """Refresh JWT token."""
-    try:
-        result = auth_service.refresh_access_token(credentials.credentials)
-        return TokenDto(**result)
-    except UnauthorizedError as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e),
-            headers={"WWW-Authenticate": "Bearer"},
-        ) 
\ No newline at end of file
+    result = auth_service.refresh_access_token(credentials.credentials)
+    # The token dict is built by AuthService with TokenDto's fields, skip revalidating it
+    return ORJSONResponse(result)
@@ -1,3 +1,4 @@
+import operator
 from typing import Optional, List
 from src.shared.application.command import CommandHandler
 from src.shared.application.query import QueryHandler
@@ -20,20 +21,42 @@ from src.contexts.users.application.queries import (
     GetUserByIdQuery, GetUserByEmailQuery, GetUserByUsernameQuery, GetUsersQuery
 )
 from src.contexts.users.application.dtos import UserDto, UserListDto
+from src.contexts.users.application.read_repositories import UserReadRepository
+
+
+# Fields copied onto UserDto, fetched in a single C-level attribute walk
+_USER_FIELDS = operator.attrgetter(
+    "id",
+    "email.value",
+    "username.value",
+    "full_name.first_name",
+    "full_name.last_name",
+    "full_name.full_name",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
 
 
 def user_to_dto(user: User) -> UserDto:
-    """Convert User entity to DTO."""
-    return UserDto(
-        id=user.id,
-        email=user.email.value,
-        username=user.username.value,
-        first_name=user.full_name.first_name,
-        last_name=user.full_name.last_name,
-        full_name=user.full_name.full_name,
-        is_active=user.is_active,
-        created_at=user.created_at,
-        updated_at=user.updated_at
+    """Convert User entity to DTO.
+    
+    The entity has already been validated by its value objects, so the DTO is
+    built without running pydantic validation again.
+    """
+    user_id, email, username, first_name, last_name, full_name, is_active, created_at, updated_at = (
+        _USER_FIELDS(user)
+    )
+    return UserDto.model_construct(
+        id=user_id,
+        email=email,
+        username=username,
+        first_name=first_name,
+        last_name=last_name,
+        full_name=full_name,
+        is_active=is_active,
+        created_at=created_at,
+        updated_at=updated_at
     )
 
 
@@ -49,17 +72,8 @@ class CreateUserCommandHandler(CommandHandler[CreateUserCommand]):
     async def handle(self, command: CreateUserCommand) -> UserDto:
         """Handle the create user command."""
         try:
-            # Check if user already exists
-            if await self.user_repository.exists_by_email(command.email):
-                record_user_operation("create", "error_duplicate_email")
-                raise AlreadyExistsError(f"User with email {command.email} already exists")
-            
-            if await self.user_repository.exists_by_username(command.username):
-                record_user_operation("create", "error_duplicate_username")
-                raise AlreadyExistsError(f"User with username {command.username} already exists")
-            
-            # Hash password
-            hashed_password = self.password_service.hash_password(command.password)
+            # Hash password off the event loop, bcrypt is slow by design
+            hashed_password = await self.password_service.hash_password_async(command.password)
             
             # Create user
             user = User.create(
@@ -70,14 +84,22 @@ class CreateUserCommandHandler(CommandHandler[CreateUserCommand]):
                 hashed_password=hashed_password
             )
             
-            # Save user
-            saved_user = await self.user_repository.save(user)
+            # Save user, the database rejects duplicates in the same statement
+            saved_user = await self.user_repository.insert_if_absent(user)
+            if saved_user is None:
+                conflict = await self.user_repository.find_conflicting(command.email, command.username)
+                if conflict == "email":
+                    record_user_operation("create", "error_duplicate_email")
+                    raise AlreadyExistsError(f"User with email {command.email} already exists")
+                
+                record_user_operation("create", "error_duplicate_username")
+                raise AlreadyExistsError(f"User with username {command.username} already exists")
             
-            # Publish domain events
-            events = saved_user.get_domain_events()
+            # Publish domain events raised on the entity we created
+            events = user.get_domain_events()
             if events:
+                user.clear_domain_events()
                 await self.event_bus.publish(events)
-                saved_user.clear_domain_events()
             
             record_user_operation("create", "success")
             return user_to_dto(saved_user)
@@ -106,11 +128,11 @@ class UpdateUserCommandHandler(CommandHandler[UpdateUserCommand]):
         
         saved_user = await self.user_repository.save(user)
         
-        # Publish domain events
-        events = saved_user.get_domain_events()
+        # Publish domain events raised on the entity we updated
+        events = user.get_domain_events()
         if events:
+            user.clear_domain_events()
             await self.event_bus.publish(events)
-            saved_user.clear_domain_events()
         
         return user_to_dto(saved_user)
 
@@ -140,18 +162,16 @@ class GetUserByIdQueryHandler(QueryHandler[GetUserByIdQuery, Optional[UserDto]])
 class GetUsersQueryHandler(QueryHandler[GetUsersQuery, UserListDto]):
     """Handler for getting all users."""
     
-    def __init__(self, user_repository: UserRepository):
-        self.user_repository = user_repository
+    def __init__(self, user_read_repository: UserReadRepository):
+        self.user_read_repository = user_read_repository
     
     async def handle(self, query: GetUsersQuery) -> UserListDto:
         """Handle the get users query."""
-        users = await self.user_repository.find_all(limit=query.limit, offset=query.offset)
-        
-        user_dtos = [user_to_dto(user) for user in users]
+        user_dtos, total = await self.user_read_repository.find_all_dto(limit=query.limit, offset=query.offset)
         
-        return UserListDto(
+        return UserListDto.model_construct(
             users=user_dtos,
-            total=len(user_dtos),
+            total=total,
             limit=query.limit,
             offset=query.offset
         )
@@ -178,7 +198,7 @@ class DeleteUserCommandHandler(CommandHandler[DeleteUserCommand]):
         # Publish domain events
         events = user.get_domain_events()
         if events:
-            await self.event_bus.publish(events)
             user.clear_domain_events()
+            await self.event_bus.publish(events)
         
         return True 
\ No newline at end of file
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+from src.contexts.users.application.dtos import UserDto
+
+
+class UserReadRepository(ABC):
+    """Read-side repository returning user DTOs straight from storage."""
+    
+    @abstractmethod
+    async def find_all_dto(self, limit: int = 100, offset: int = 0) -> Tuple[List[UserDto], int]:
+        """Find a page of users as DTOs along with the total number of users."""
+        pass
@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from typing import Optional
 from src.shared.domain.base_entity import BaseEntity, DomainEvent
 from src.contexts.users.domain.value_objects import Email, Username, FullName, HashedPassword
@@ -6,27 +7,29 @@ from src.contexts.users.domain.value_objects import Email, Username, FullName, H
 class UserCreated(DomainEvent):
     """Domain event for when a user is created."""
     
-    def __init__(self, user_id: str, email: str, username: str):
+    def __init__(self, user_id: str, email: str, username: str, occurred_at: Optional[datetime] = None):
         super().__init__(
             event_type="user_created",
             data={
                 "user_id": user_id,
                 "email": email,
                 "username": username
-            }
+            },
+            occurred_at=occurred_at
         )
 
 
 class UserUpdated(DomainEvent):
     """Domain event for when a user is updated."""
     
-    def __init__(self, user_id: str, changes: dict):
+    def __init__(self, user_id: str, changes: dict, occurred_at: Optional[datetime] = None):
         super().__init__(
             event_type="user_updated",
             data={
                 "user_id": user_id,
                 "changes": changes
-            }
+            },
+            occurred_at=occurred_at
         )
 
 
@@ -40,9 +43,10 @@ class User(BaseEntity):
         username: Optional[Username] = None,
         full_name: Optional[FullName] = None,
         hashed_password: Optional[HashedPassword] = None,
-        is_active: bool = True
+        is_active: bool = True,
+        now: Optional[datetime] = None
     ):
-        super().__init__(user_id)
+        super().__init__(user_id, now)
         self._email = email
         self._username = username
         self._full_name = full_name
@@ -76,27 +80,32 @@ class User(BaseEntity):
         username: str,
         first_name: str,
         last_name: str,
-        hashed_password: str
+        hashed_password: str,
+        now: Optional[datetime] = None
     ) -> "User":
         """Factory method to create a new user."""
+        # One timestamp for the entity and its creation event
+        now = now or datetime.now(timezone.utc)
         user = cls(
             email=Email(email),
             username=Username(username),
             full_name=FullName(first_name, last_name),
             hashed_password=HashedPassword(hashed_password),
-            is_active=True
+            is_active=True,
+            now=now
         )
         
         # Add domain event
         user.add_domain_event(UserCreated(
             user_id=user.id,
             email=email,
-            username=username
+            username=username,
+            occurred_at=now
         ))
         
         return user
     
-    def update_profile(self, first_name: str = None, last_name: str = None) -> None:
+    def update_profile(self, first_name: str = None, last_name: str = None, now: Optional[datetime] = None) -> None:
         """Update user profile information."""
         changes = {}
         
@@ -111,28 +120,34 @@ class User(BaseEntity):
             changes["full_name"] = self._full_name.full_name
         
         if changes:
-            self.mark_updated()
+            now = now or datetime.now(timezone.utc)
+            self.mark_updated(now)
             self.add_domain_event(UserUpdated(
                 user_id=self.id,
-                changes=changes
+                changes=changes,
+                occurred_at=now
             ))
     
-    def deactivate(self) -> None:
+    def deactivate(self, now: Optional[datetime] = None) -> None:
         """Deactivate the user."""
         if self._is_active:
             self._is_active = False
-            self.mark_updated()
+            now = now or datetime.now(timezone.utc)
+            self.mark_updated(now)
             self.add_domain_event(UserUpdated(
                 user_id=self.id,
-                changes={"is_active": False}
+                changes={"is_active": False},
+                occurred_at=now
             ))
     
-    def activate(self) -> None:
+    def activate(self, now: Optional[datetime] = None) -> None:
         """Activate the user."""
         if not self._is_active:
             self._is_active = True
-            self.mark_updated()
+            now = now or datetime.now(timezone.utc)
+            self.mark_updated(now)
             self.add_domain_event(UserUpdated(
                 user_id=self.id,
-                changes={"is_active": True}
+                changes={"is_active": True},
+                occurred_at=now
             )) 
\ No newline at end of file
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from src.contexts.users.domain.entities import User
 
 
@@ -11,6 +11,14 @@ class UserRepository(ABC):
         """Save a user entity."""
         pass
     
+    @abstractmethod
+    async def insert_if_absent(self, user: User) -> Optional[User]:
+        """Insert a new user unless its email or username is taken.
+        
+        Returns None when the user conflicts with an existing one.
+        """
+        pass
+    
     @abstractmethod
     async def find_by_id(self, user_id: str) -> Optional[User]:
         """Find a user by ID."""
@@ -27,8 +35,8 @@ class UserRepository(ABC):
         pass
     
     @abstractmethod
-    async def find_all(self, limit: int = 100, offset: int = 0) -> List[User]:
-        """Find all users with pagination."""
+    async def find_all(self, limit: int = 100, offset: int = 0) -> Tuple[List[User], int]:
+        """Find a page of users along with the total number of users."""
         pass
     
     @abstractmethod
@@ -44,4 +52,9 @@ class UserRepository(ABC):
     @abstractmethod
     async def exists_by_username(self, username: str) -> bool:
         """Check if a user exists by username."""
-        pass 
\ No newline at end of file
+        pass 
+    
+    @abstractmethod
+    async def find_conflicting(self, email: str, username: str) -> Optional[str]:
+        """Find which of email or username is already taken, if any."""
+        pass
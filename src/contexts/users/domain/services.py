@@ -1,32 +1,91 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from passlib.context import CryptContext
 from src.shared.domain.exceptions import ValidationError
 
 
+# Building a CryptContext loads and configures its handlers, so it is done
+# once and shared by every PasswordService
+_PWD_CONTEXT = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# bcrypt is CPU bound, so more threads than cores would only queue up
+_BCRYPT_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("BCRYPT_WORKERS", str(os.cpu_count() or 1))),
+    thread_name_prefix="bcrypt"
+)
+
+
 class PasswordService:
     """Domain service for password operations."""
     
     def __init__(self):
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self.pwd_context = _PWD_CONTEXT
     
-    def hash_password(self, password: str) -> str:
-        """Hash a password."""
+    def validate_password(self, password: str) -> None:
+        """Raise ValidationError unless the password meets the requirements."""
         if not self._is_valid_password(password):
             raise ValidationError("Password does not meet requirements")
+    
+    def hash_password(self, password: str) -> str:
+        """Hash a password."""
+        self.validate_password(password)
         return self.pwd_context.hash(password)
     
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        """Verify a password against its hash."""
-        return self.pwd_context.verify(plain_password, hashed_password)
+        """Verify a password against its hash.
+        
+        passlib compares the computed digest in constant time, so the time
+        taken does not depend on how much of the hash matches. A stored hash
+        that cannot be parsed fails verification after the same amount of
+        work, instead of raising.
+        """
+        try:
+            return self.pwd_context.verify(plain_password, hashed_password)
+        except ValueError:
+            self.pwd_context.dummy_verify()
+            return False
+    
+    def dummy_verify(self) -> bool:
+        """Spend the time of a password verification against a dummy hash.
+        
+        Used when there is no hash to check against, so that a missing account
+        takes as long to reject as a wrong password.
+        """
+        return self.pwd_context.dummy_verify()
+    
+    async def hash_password_async(self, password: str) -> str:
+        """Hash a password on the bcrypt pool, keeping the event loop free."""
+        self.validate_password(password)
+        return await asyncio.get_running_loop().run_in_executor(_BCRYPT_POOL, self.pwd_context.hash, password)
+    
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password on the bcrypt pool, keeping the event loop free."""
+        return await asyncio.get_running_loop().run_in_executor(
+            _BCRYPT_POOL, self.verify_password, plain_password, hashed_password
+        )
+    
+    async def dummy_verify_async(self) -> bool:
+        """Run dummy_verify on the bcrypt pool, keeping the event loop free."""
+        return await asyncio.get_running_loop().run_in_executor(_BCRYPT_POOL, self.dummy_verify)
     
     @staticmethod
     def _is_valid_password(password: str) -> bool:
         """Validate password requirements."""
         if not password or len(password) < 8:
             return False
-        if not any(c.isupper() for c in password):
-            return False
-        if not any(c.islower() for c in password):
-            return False
-        if not any(c.isdigit() for c in password):
-            return False
-        return True 
\ No newline at end of file
+        
+        # Single pass, stopping as soon as all three classes have been seen
+        has_upper = has_lower = has_digit = False
+        for c in password:
+            if c.isupper():
+                has_upper = True
+            elif c.islower():
+                has_lower = True
+            elif c.isdigit():
+                has_digit = True
+            else:
+                continue
+            if has_upper and has_lower and has_digit:
+                return True
+        return False 
\ No newline at end of file
@@ -1,8 +1,18 @@
 import re
+from functools import lru_cache
 from src.shared.domain.base_value_object import BaseValueObject
 from src.shared.domain.exceptions import ValidationError
 
 
+# Compiled once, matched against the whole value
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_USERNAME_RE = re.compile(r'[a-zA-Z0-9_]+')
+
+# Validation is a pure function of the string, so the verdicts are cached;
+# the same emails and usernames are validated again on every request
+_VALIDATION_CACHE_SIZE = 4096
+
+
 class Email(BaseValueObject):
     """Email value object with validation."""
     
@@ -11,11 +21,18 @@ class Email(BaseValueObject):
             raise ValidationError(f"Invalid email format: {value}")
         self.value = value.lower()
     
+    @classmethod
+    def from_trusted(cls, value: str) -> "Email":
+        """Build an email already validated and normalized, e.g. read back from storage."""
+        email = cls.__new__(cls)
+        email.value = value
+        return email
+    
     @staticmethod
+    @lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
     def _is_valid_email(email: str) -> bool:
         """Validate email format."""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return _EMAIL_RE.fullmatch(email) is not None
 
 
 class Username(BaseValueObject):
@@ -26,12 +43,20 @@ class Username(BaseValueObject):
             raise ValidationError(f"Invalid username: {value}")
         self.value = value
     
+    @classmethod
+    def from_trusted(cls, value: str) -> "Username":
+        """Build a username already validated, e.g. read back from storage."""
+        username = cls.__new__(cls)
+        username.value = value
+        return username
+    
     @staticmethod
+    @lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
     def _is_valid_username(username: str) -> bool:
         """Validate username format."""
         if not username or len(username) < 3 or len(username) > 50:
             return False
-        if not re.match(r'^[a-zA-Z0-9_]+$', username):
+        if not _USERNAME_RE.fullmatch(username):
             return False
         return True
 
@@ -48,6 +73,14 @@ class FullName(BaseValueObject):
         self.first_name = first_name.strip()
         self.last_name = last_name.strip()
     
+    @classmethod
+    def from_trusted(cls, first_name: str, last_name: str) -> "FullName":
+        """Build a full name already validated and stripped, e.g. read back from storage."""
+        full_name = cls.__new__(cls)
+        full_name.first_name = first_name
+        full_name.last_name = last_name
+        return full_name
+    
     @property
     def full_name(self) -> str:
         """Get full name as a single string."""
@@ -60,4 +93,11 @@ class HashedPassword(BaseValueObject):
     def __init__(self, hashed_value: str):
         if not hashed_value:
             raise ValidationError("Hashed password cannot be empty")
-        self.hashed_value = hashed_value 
\ No newline at end of file
+        self.hashed_value = hashed_value
+    
+    @classmethod
+    def from_trusted(cls, hashed_value: str) -> "HashedPassword":
+        """Build a hashed password already validated, e.g. read back from storage."""
+        hashed_password = cls.__new__(cls)
+        hashed_password.hashed_value = hashed_value
+        return hashed_password
@@ -1,13 +1,12 @@
 import asyncio
-import json
 import logging
 from typing import Dict, Any
-from src.shared.infrastructure.message_broker import RabbitMQBroker
+from src.shared.infrastructure.message_broker import get_broker
 from src.contexts.users.application.commands import CreateUserCommand
 from src.contexts.users.application.handlers import CreateUserCommandHandler
 from src.contexts.users.infrastructure.repositories import SQLAlchemyUserRepository
 from src.contexts.users.domain.services import PasswordService
-from src.shared.infrastructure.database import SessionLocal
+from src.shared.infrastructure.database import ConsumerSessionLocal
 from src.shared.application.event_bus import EventBus
 from src.shared.infrastructure.metrics import record_message_consumed
 
@@ -15,11 +14,22 @@ from src.shared.infrastructure.metrics import record_message_consumed
 logger = logging.getLogger(__name__)
 
 
+class _NullEventBus(EventBus):
+    """Event bus that only logs events; the consumer does not republish them."""
+    
+    async def publish(self, events):
+        logger.debug("Publishing events: %s", events)
+
+
+# Dummy event bus for now, created once instead of per message
+_NULL_EVENT_BUS = _NullEventBus()
+
+
 class UserCommandConsumer:
     """Consumer for user commands from RabbitMQ."""
     
     def __init__(self):
-        self.broker = RabbitMQBroker()
+        self.broker = get_broker()
         self.password_service = PasswordService()
     
     async def start_consuming(self):
@@ -33,37 +43,28 @@ class UserCommandConsumer:
             command_type = message.get("command_type")
             command_data = message.get("data", {})
             
-            logger.info(f"Processing user command: {command_type}")
+            logger.debug("Processing user command: %s", command_type)
             
             if command_type == "create_user":
                 await self._handle_create_user(command_data)
                 record_message_consumed(queue_name, "success")
             else:
-                logger.warning(f"Unknown command type: {command_type}")
+                logger.warning("Unknown command type: %s", command_type)
                 record_message_consumed(queue_name, "unknown_command")
                 
         except Exception as e:
             record_message_consumed(queue_name, "error")
-            logger.error(f"Error processing user command: {e}")
+            logger.error("Error processing user command: %s", e)
             raise
     
     async def _handle_create_user(self, data: Dict[str, Any]):
         """Handle create user command."""
         try:
             # Create database session
-            db = SessionLocal()
-            
-            try:
-                # Create repository and event bus
+            async with ConsumerSessionLocal() as db:
+                # Create repository
                 user_repository = SQLAlchemyUserRepository(db)
                 
-                # Dummy event bus for now
-                class DummyEventBus(EventBus):
-                    async def publish(self, events):
-                        logger.info(f"Publishing events: {[e.event_type for e in events]}")
-                
-                event_bus = DummyEventBus()
-                
                 # Create command
                 command = CreateUserCommand(
                     email=data["email"],
@@ -74,16 +75,13 @@ class UserCommandConsumer:
                 )
                 
                 # Execute command
-                handler = CreateUserCommandHandler(user_repository, self.password_service, event_bus)
+                handler = CreateUserCommandHandler(user_repository, self.password_service, _NULL_EVENT_BUS)
                 result = await handler.handle(command)
                 
-                logger.info(f"User created successfully: {result.id}")
-                
-            finally:
-                db.close()
+                logger.info("User created successfully: %s", result.id)
                 
         except Exception as e:
-            logger.error(f"Failed to create user: {e}")
+            logger.error("Failed to create user: %s", e)
             raise
 
 
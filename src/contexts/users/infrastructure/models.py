@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime
+from sqlalchemy import Column, String, Boolean, DateTime, Index
 from sqlalchemy.sql import func
 from src.shared.infrastructure.database import Base
 
@@ -7,6 +7,9 @@ class UserModel(Base):
     """SQLAlchemy model for User entity."""
     
     __tablename__ = "users"
+    # Fetch server-generated values in the INSERT/UPDATE itself (RETURNING),
+    # so they never need a lazy load after commit
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(String, primary_key=True, index=True)
     email = Column(String, unique=True, index=True, nullable=False)
@@ -16,4 +19,8 @@ class UserModel(Base):
     hashed_password = Column(String, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now()) 
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+# Emails are matched case-insensitively, so uniqueness is enforced on lower(email)
+Index("ix_users_email_lower", func.lower(UserModel.email), unique=True)
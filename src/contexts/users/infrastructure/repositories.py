@@ -1,17 +1,30 @@
-from typing import Optional, List
-from sqlalchemy.orm import Session
-from sqlalchemy import select, func
+from typing import Dict, Optional, List, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, or_, insert, exists
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from src.contexts.users.application.dtos import UserDto
+from src.contexts.users.application.read_repositories import UserReadRepository
 from src.contexts.users.domain.entities import User
 from src.contexts.users.domain.repositories import UserRepository
 from src.contexts.users.domain.value_objects import Email, Username, FullName, HashedPassword
 from src.contexts.users.infrastructure.models import UserModel
 
 
+# Dialects whose INSERT supports ON CONFLICT DO NOTHING
+_ON_CONFLICT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
 class SQLAlchemyUserRepository(UserRepository):
     """SQLAlchemy implementation of UserRepository."""
     
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
+        # Identity map for the lifetime of the session, i.e. one request
+        self._users_by_id: Dict[str, User] = {}
     
     async def save(self, user: User) -> User:
         """Save a user entity."""
@@ -41,42 +54,108 @@ class SQLAlchemyUserRepository(UserRepository):
             )
             self.session.add(user_model)
         
-        self.session.commit()
-        self.session.refresh(user_model)
+        # Every column is set from the entity, so there is nothing to re-read
+        await self.session.commit()
         
-        return self._to_entity(user_model)
+        saved_user = self._to_entity(user_model)
+        self._users_by_id[saved_user.id] = saved_user
+        return saved_user
+    
+    async def insert_if_absent(self, user: User) -> Optional[User]:
+        """Insert a new user unless its email or username is taken.
+        
+        On PostgreSQL and SQLite the conflict is resolved by the database in
+        the same statement, so the happy path is a single round trip.
+        """
+        values = {
+            "id": user.id,
+            "email": user.email.value,
+            "username": user.username.value,
+            "first_name": user.full_name.first_name,
+            "last_name": user.full_name.last_name,
+            "hashed_password": user.hashed_password.hashed_value,
+            "is_active": user.is_active,
+            "created_at": user.created_at,
+            "updated_at": user.updated_at,
+        }
+        dialect = self.session.get_bind().dialect.name
+        if dialect in _ON_CONFLICT_INSERTS:
+            stmt = (
+                _ON_CONFLICT_INSERTS[dialect](UserModel)
+                .values(**values)
+                .on_conflict_do_nothing()
+                .returning(UserModel.id)
+            )
+            inserted = (await self.session.execute(stmt)).scalar()
+            await self.session.commit()
+            return self._remember(user) if inserted is not None else None
+        
+        try:
+            await self.session.execute(insert(UserModel).values(**values))
+            await self.session.commit()
+        except IntegrityError:
+            await self.session.rollback()
+            return None
+        return self._remember(user)
     
     async def find_by_id(self, user_id: str) -> Optional[User]:
         """Find a user by ID."""
+        user = self._users_by_id.get(user_id)
+        if user is not None:
+            return user
         user_model = await self._find_model_by_id(user_id)
         if not user_model:
             return None
-        return self._to_entity(user_model)
+        return self._remember(self._to_entity(user_model))
     
     async def find_by_email(self, email: str) -> Optional[User]:
-        """Find a user by email."""
-        stmt = select(UserModel).where(UserModel.email == email.lower())
-        result = self.session.execute(stmt)
+        """Find a user by email.
+        
+        Always read from the database: login trusts the hash and active flag
+        it returns, so they must not be stale.
+        """
+        stmt = select(UserModel).where(func.lower(UserModel.email) == email.lower())
+        result = await self.session.execute(stmt)
         user_model = result.scalars().first()
         if not user_model:
             return None
-        return self._to_entity(user_model)
+        
+        user = self._users_by_id.get(user_model.id)
+        if user is not None:
+            return user
+        return self._remember(self._to_entity(user_model))
     
     async def find_by_username(self, username: str) -> Optional[User]:
         """Find a user by username."""
         stmt = select(UserModel).where(UserModel.username == username)
-        result = self.session.execute(stmt)
+        result = await self.session.execute(stmt)
         user_model = result.scalars().first()
         if not user_model:
             return None
         return self._to_entity(user_model)
     
-    async def find_all(self, limit: int = 100, offset: int = 0) -> List[User]:
-        """Find all users with pagination."""
-        stmt = select(UserModel).offset(offset).limit(limit)
-        result = self.session.execute(stmt)
-        user_models = result.scalars().all()
-        return [self._to_entity(model) for model in user_models]
+    async def find_all(self, limit: int = 100, offset: int = 0) -> Tuple[List[User], int]:
+        """Find a page of users along with the total number of users.
+        
+        The total is computed with a window function so the page and the
+        count come back in a single round trip.
+        """
+        stmt = (
+            select(UserModel, func.count().over().label("total"))
+            .order_by(UserModel.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        rows = result.all()
+        if rows:
+            return [self._to_entity(row[0]) for row in rows], rows[0].total
+        
+        # An empty page past the end carries no count, so ask for it directly
+        total = 0
+        if offset > 0:
+            total = await self.session.scalar(select(func.count(UserModel.id)))
+        return [], total
     
     async def delete(self, user_id: str) -> bool:
         """Delete a user by ID."""
@@ -84,38 +163,59 @@ class SQLAlchemyUserRepository(UserRepository):
         if not user_model:
             return False
         
-        self.session.delete(user_model)
-        self.session.commit()
+        await self.session.delete(user_model)
+        await self.session.commit()
+        self._users_by_id.pop(user_id, None)
         return True
     
     async def exists_by_email(self, email: str) -> bool:
         """Check if a user exists by email."""
-        stmt = select(func.count(UserModel.id)).where(UserModel.email == email.lower())
-        result = self.session.execute(stmt)
-        count = result.scalar()
-        return count > 0
+        # EXISTS stops at the first match instead of counting every row
+        stmt = select(exists().where(func.lower(UserModel.email) == email.lower()))
+        return await self.session.scalar(stmt)
     
     async def exists_by_username(self, username: str) -> bool:
         """Check if a user exists by username."""
-        stmt = select(func.count(UserModel.id)).where(UserModel.username == username)
-        result = self.session.execute(stmt)
-        count = result.scalar()
-        return count > 0
+        stmt = select(exists().where(UserModel.username == username))
+        return await self.session.scalar(stmt)
+    
+    async def find_conflicting(self, email: str, username: str) -> Optional[str]:
+        """Find which of email or username is already taken, if any."""
+        email = email.lower()
+        stmt = (
+            select(UserModel.email, UserModel.username)
+            .where(or_(func.lower(UserModel.email) == email, UserModel.username == username))
+            .limit(2)
+        )
+        result = await self.session.execute(stmt)
+        rows = result.all()
+        if any(row.email.lower() == email for row in rows):
+            return "email"
+        if rows:
+            return "username"
+        return None
     
     async def _find_model_by_id(self, user_id: str) -> Optional[UserModel]:
-        """Find a user model by ID."""
-        stmt = select(UserModel).where(UserModel.id == user_id)
-        result = self.session.execute(stmt)
-        return result.scalars().first()
+        """Find a user model by ID, skipping the query if the session has it."""
+        return await self.session.get(UserModel, user_id)
+    
+    def _remember(self, user: User) -> User:
+        """Add a loaded user to the identity map."""
+        self._users_by_id[user.id] = user
+        return user
     
     def _to_entity(self, model: UserModel) -> User:
-        """Convert UserModel to User entity."""
+        """Convert UserModel to User entity.
+        
+        Stored values were validated on their way in, so the value objects
+        are rebuilt without validating them again.
+        """
         user = User(
             user_id=model.id,
-            email=Email(model.email),
-            username=Username(model.username),
-            full_name=FullName(model.first_name, model.last_name),
-            hashed_password=HashedPassword(model.hashed_password),
+            email=Email.from_trusted(model.email),
+            username=Username.from_trusted(model.username),
+            full_name=FullName.from_trusted(model.first_name, model.last_name),
+            hashed_password=HashedPassword.from_trusted(model.hashed_password),
             is_active=model.is_active
         )
         
@@ -123,4 +223,58 @@ class SQLAlchemyUserRepository(UserRepository):
         user._created_at = model.created_at
         user._updated_at = model.updated_at
         
-        return user 
\ No newline at end of file
+        return user
+
+
+class SQLAlchemyUserReadRepository(UserReadRepository):
+    """SQLAlchemy implementation of UserReadRepository."""
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+    
+    async def find_all_dto(self, limit: int = 100, offset: int = 0) -> Tuple[List[UserDto], int]:
+        """Find a page of users as DTOs along with the total number of users.
+        
+        Selects plain columns, so rows skip ORM hydration and entity
+        construction and go straight into the DTOs.
+        """
+        stmt = (
+            select(
+                UserModel.id,
+                UserModel.email,
+                UserModel.username,
+                UserModel.first_name,
+                UserModel.last_name,
+                UserModel.is_active,
+                UserModel.created_at,
+                UserModel.updated_at,
+                func.count().over().label("total"),
+            )
+            .order_by(UserModel.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        rows = result.all()
+        if not rows:
+            # An empty page past the end carries no count, so ask for it directly
+            total = 0
+            if offset > 0:
+                total = await self.session.scalar(select(func.count(UserModel.id)))
+            return [], total
+        
+        users = [
+            UserDto.model_construct(
+                id=user_id,
+                email=email,
+                username=username,
+                first_name=first_name,
+                last_name=last_name,
+                full_name=f"{first_name} {last_name}",
+                is_active=is_active,
+                created_at=created_at,
+                updated_at=updated_at
+            )
+            for user_id, email, username, first_name, last_name, is_active, created_at, updated_at, _ in rows
+        ]
+        return users, rows[0].total
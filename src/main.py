@@ -1,11 +1,16 @@
-from fastapi import FastAPI, Response
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from src.shared.infrastructure.database import create_tables
-from src.contexts.users.infrastructure.adapters import router as users_router
+from fastapi.responses import ORJSONResponse
+from src.shared.domain.exceptions import AlreadyExistsError, NotFoundError, UnauthorizedError, ValidationError
+from src.shared.infrastructure.database import create_tables, ping_database
+from src.shared.infrastructure.message_broker import get_broker
+from src.contexts.users.infrastructure.adapters import router as users_router, get_event_bus
 from src.contexts.auth.infrastructure.adapters import router as auth_router
 from src.shared.infrastructure.metrics import get_metrics, get_content_type
 from src.shared.infrastructure.metrics_middleware import PrometheusMiddleware
 import logging
+import os
+import orjson
 
 
 # Configure logging
@@ -19,13 +24,53 @@ app = FastAPI(
     version="1.0.0",
 )
 
-# Configure CORS
+# Headers sent with every 401, built once
+_WWW_AUTHENTICATE_HEADERS = {"WWW-Authenticate": "Bearer"}
+
+
+def _error_response(exc: Exception, status_code: int, headers: dict = None) -> Response:
+    """Build a JSON {"detail": ...} error response from an exception."""
+    body = orjson.dumps({"detail": str(exc)})
+    return Response(body, status_code=status_code, headers=headers, media_type="application/json")
+
+
+@app.exception_handler(UnauthorizedError)
+async def unauthorized_handler(request: Request, exc: UnauthorizedError) -> Response:
+    """Turn authentication failures into 401 responses."""
+    return _error_response(exc, 401, _WWW_AUTHENTICATE_HEADERS)
+
+
+@app.exception_handler(NotFoundError)
+async def not_found_handler(request: Request, exc: NotFoundError) -> Response:
+    """Turn missing entities into 404 responses."""
+    return _error_response(exc, 404)
+
+
+@app.exception_handler(ValidationError)
+async def validation_error_handler(request: Request, exc: ValidationError) -> Response:
+    """Turn domain validation failures into 400 responses."""
+    return _error_response(exc, 400)
+
+
+@app.exception_handler(AlreadyExistsError)
+async def already_exists_handler(request: Request, exc: AlreadyExistsError) -> Response:
+    """Turn duplicate entities into 409 responses."""
+    return _error_response(exc, 409)
+
+
+# Configure CORS from an explicit allow-list, so preflights are plain set lookups
+ALLOWED_ORIGINS = [
+    origin.strip() for origin in os.getenv("ALLOWED_ORIGINS", "*").split(",") if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify actual origins
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=ALLOWED_ORIGINS,
+    # With the wildcard Starlette would echo any Origin back with credentials
+    # allowed; auth is a bearer header, so cross-site cookies aren't needed
+    allow_credentials="*" not in ALLOWED_ORIGINS,
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["authorization", "content-type"],
 )
 
 # Add Prometheus metrics middleware
@@ -42,9 +87,21 @@ async def startup_event():
     logger.info("Starting Hexagonal Architecture API...")
     
     # Create database tables
-    create_tables()
+    await create_tables()
     logger.info("Database tables created")
     
+    # Publish domain events from a background outbox on this event loop
+    event_bus = get_event_bus()
+    event_bus.start()
+    
+    # Declare event queues now rather than on the first publish; the API
+    # still starts if RabbitMQ is not reachable yet
+    try:
+        await event_bus.declare_queues()
+        logger.info("Event queues declared")
+    except Exception as e:
+        logger.warning("Could not declare event queues: %s", e)
+    
     logger.info("Application started successfully")
 
 
@@ -52,6 +109,18 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on application shutdown."""
     logger.info("Shutting down Hexagonal Architecture API...")
+    
+    # Don't lose events still waiting to be published
+    try:
+        await get_event_bus().close()
+    except Exception as e:
+        logger.warning("Could not publish queued events: %s", e)
+    
+    # Only then close the RabbitMQ channels and connections
+    try:
+        await get_broker().close()
+    except Exception as e:
+        logger.warning("Could not close the RabbitMQ connection: %s", e)
 
 
 @app.get("/")
@@ -67,6 +136,11 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
+    if not await ping_database():
+        return ORJSONResponse(
+            {"status": "unhealthy", "message": "Database is unreachable"},
+            status_code=503
+        )
     return {"status": "healthy", "message": "API is running correctly"}
 
 
@@ -75,5 +149,6 @@ async def metrics():
     """Prometheus metrics endpoint."""
     return Response(
         content=get_metrics(),
-        media_type=get_content_type()
+        media_type=get_content_type(),
+        headers={"Cache-Control": "no-cache"}
     ) 
\ No newline at end of file
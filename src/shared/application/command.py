@@ -1,11 +1,16 @@
 from abc import ABC, abstractmethod
 from typing import Any, TypeVar, Generic
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Command(BaseModel, ABC):
-    """Base class for commands in CQRS pattern."""
-    pass
+    """Base class for commands in CQRS pattern.
+    
+    Commands are immutable messages, routes build them with model_construct
+    from input FastAPI has already validated.
+    """
+    
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
 
 T = TypeVar('T')
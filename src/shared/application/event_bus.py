@@ -23,4 +23,4 @@ class EventHandler(ABC):
     @abstractmethod
     async def handle(self, event: DomainEvent) -> None:
         """Handle the domain event."""
-        pass 
\ No newline at end of file
+        pass
\ No newline at end of file
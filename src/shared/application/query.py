@@ -1,11 +1,16 @@
 from abc import ABC, abstractmethod
 from typing import Any, TypeVar, Generic
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Query(BaseModel, ABC):
-    """Base class for queries in CQRS pattern."""
-    pass
+    """Base class for queries in CQRS pattern.
+    
+    Queries are immutable messages, routes build them with model_construct
+    from input FastAPI has already validated.
+    """
+    
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
 
 T = TypeVar('T')
@@ -1,27 +1,58 @@
 from abc import ABC
-from typing import Any, Dict, List
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
 from datetime import datetime, timezone
+import os
 import uuid
 
 
+_UUID_BATCH_SIZE = 256
+_uuid_buffer: Deque[str] = deque()
+
+# A forked worker inherits the parent's buffered ids; drop them so no two
+# processes hand out the same one
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_uuid_buffer.clear)
+
+
+def _batch_uuids(n: int = _UUID_BATCH_SIZE) -> List[str]:
+    """Build n random UUID4 strings from a single urandom read."""
+    buf = os.urandom(16 * n)
+    return [str(uuid.UUID(bytes=buf[i:i + 16], version=4)) for i in range(0, 16 * n, 16)]
+
+
+def new_id() -> str:
+    """Return a fresh UUID4 string, refilling the buffer in batches."""
+    # deque.popleft/extend are atomic, so concurrent callers never share an id
+    try:
+        return _uuid_buffer.popleft()
+    except IndexError:
+        _uuid_buffer.extend(_batch_uuids())
+        return _uuid_buffer.popleft()
+
+
 class DomainEvent:
     """Base class for domain events."""
     
-    def __init__(self, event_type: str, data: Dict[str, Any]):
+    def __init__(self, event_type: str, data: Dict[str, Any], occurred_at: Optional[datetime] = None):
         self.event_type = event_type
         self.data = data
-        self.occurred_at = datetime.now(timezone.utc)
-        self.event_id = str(uuid.uuid4())
+        self.occurred_at = occurred_at or datetime.now(timezone.utc)
+        self.event_id = new_id()
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.event_type!r})"
 
 
 class BaseEntity(ABC):
     """Base entity class following DDD principles."""
     
-    def __init__(self, entity_id: str = None):
-        self._id = entity_id or str(uuid.uuid4())
+    def __init__(self, entity_id: str = None, now: Optional[datetime] = None):
+        now = now or datetime.now(timezone.utc)
+        self._id = entity_id or new_id()
         self._domain_events: List[DomainEvent] = []
-        self._created_at = datetime.now(timezone.utc)
-        self._updated_at = datetime.now(timezone.utc)
+        self._created_at = now
+        self._updated_at = now
     
     @property
     def id(self) -> str:
@@ -35,9 +66,9 @@ class BaseEntity(ABC):
     def updated_at(self) -> datetime:
         return self._updated_at
     
-    def mark_updated(self) -> None:
+    def mark_updated(self, now: Optional[datetime] = None) -> None:
         """Mark entity as updated."""
-        self._updated_at = datetime.now(timezone.utc)
+        self._updated_at = now or datetime.now(timezone.utc)
     
     def add_domain_event(self, event: DomainEvent) -> None:
         """Add a domain event to be published."""
@@ -1,8 +1,8 @@
-from fastapi import HTTPException, status, Depends
+from fastapi import Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.shared.infrastructure.database import get_db
-from src.contexts.auth.domain.services import AuthService
+from src.contexts.auth.domain.services import AuthService, TokenVerifier
 from src.contexts.users.infrastructure.repositories import SQLAlchemyUserRepository
 from src.contexts.users.domain.services import PasswordService
 from src.shared.domain.exceptions import UnauthorizedError
@@ -10,35 +10,32 @@ from src.shared.domain.exceptions import UnauthorizedError
 
 security = HTTPBearer()
 
+# Stateless, so a single instance is shared across requests
+_PASSWORD_SERVICE = PasswordService()
 
-def get_auth_service(db: Session = Depends(get_db)) -> AuthService:
+# Verifying a token only needs the signing key, so authenticated requests are
+# checked without opening a database session
+_TOKEN_VERIFIER = TokenVerifier()
+
+
+def get_auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
     """Get authentication service instance."""
     user_repository = SQLAlchemyUserRepository(db)
-    password_service = PasswordService()
-    return AuthService(user_repository, password_service)
+    return AuthService(user_repository, _PASSWORD_SERVICE)
 
 
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    auth_service: AuthService = Depends(get_auth_service)
+    credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     """Get current authenticated user from JWT token."""
     try:
-        payload = auth_service.verify_token(credentials.credentials)
-        user_id = payload.get("sub")
-        if user_id is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        return {"user_id": user_id, "email": payload.get("email")}
+        payload = _TOKEN_VERIFIER.verify_token(credentials.credentials)
     except UnauthorizedError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise UnauthorizedError("Invalid authentication credentials") from None
+    user_id = payload.get("sub")
+    if user_id is None:
+        raise UnauthorizedError("Invalid authentication credentials")
+    return {"user_id": user_id, "email": payload.get("email")}
 
 
 async def get_current_user_id(
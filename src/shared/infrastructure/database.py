@@ -1,7 +1,9 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session, declarative_base
-from sqlalchemy.pool import StaticPool
-from typing import Generator
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+from sqlalchemy import text
+from sqlalchemy.pool import NullPool, StaticPool
+from typing import AsyncGenerator
+import logging
 import os
 from dotenv import load_dotenv
 
@@ -10,35 +12,91 @@ load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+# SQL logging is for debugging only; otherwise keep the engine logger quiet
+SQL_ECHO = os.getenv("DEBUG", "False").lower() == "true"
+if not SQL_ECHO:
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
+# Compiled statements kept per engine (SQLAlchemy defaults to 500)
+QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", "1200"))
+
+# Async drivers used in place of the sync ones named in DATABASE_URL
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(url: str) -> str:
+    """Rewrite a database URL to use the matching async driver."""
+    scheme, separator, rest = url.partition("://")
+    dialect = scheme.split("+", 1)[0]
+    return f"{_ASYNC_DRIVERS.get(dialect, scheme)}{separator}{rest}"
+
+
 # Configure engine based on database type
 if DATABASE_URL and "sqlite" in DATABASE_URL:
     connect_args = {"check_same_thread": False}
     poolclass = StaticPool
+    pool_options = {}
 else:
     connect_args = {}
     poolclass = None
+    # The default pool (5 + 10) runs dry under a hundred concurrent requests
+    pool_options = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        "pool_pre_ping": True,
+    }
 
-engine = create_engine(
-    DATABASE_URL,
+engine = create_async_engine(
+    to_async_url(DATABASE_URL),
     poolclass=poolclass,
     connect_args=connect_args,
-    echo=os.getenv("DEBUG", "False").lower() == "true"
+    echo=SQL_ECHO,
+    query_cache_size=QUERY_CACHE_SIZE,
+    **pool_options
+)
+
+# Background consumers run outside request scope and leave pooling to an
+# external pooler such as pgbouncer, so they open a connection per session
+consumer_engine = create_async_engine(
+    to_async_url(DATABASE_URL),
+    poolclass=poolclass or NullPool,
+    connect_args=connect_args,
+    echo=SQL_ECHO,
+    query_cache_size=QUERY_CACHE_SIZE
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Models are read after commit, so keep their state instead of lazy reloading
+SessionLocal = async_sessionmaker(engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+ConsumerSessionLocal = async_sessionmaker(
+    consumer_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
 
 Base = declarative_base()
 
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Get database session."""
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def create_tables():
+async def create_tables():
     """Create all tables."""
-    Base.metadata.create_all(bind=engine) 
\ No newline at end of file
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def ping_database() -> bool:
+    """Check the database answers a trivial query."""
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        return True
+    except Exception:
+        return False
@@ -1,54 +1,268 @@
-import json
+import asyncio
 import logging
-from typing import List
+import os
+import weakref
+from datetime import timezone
+from itertools import groupby
+from operator import itemgetter
+from typing import Awaitable, Callable, List, Optional, Tuple
+import msgpack
+import orjson
 from src.shared.application.event_bus import EventBus
 from src.shared.domain.base_entity import DomainEvent
-from src.shared.infrastructure.message_broker import RabbitMQBroker
+from src.shared.infrastructure.message_broker import JSON_CONTENT_TYPE, MSGPACK_CONTENT_TYPE, get_broker
 from src.shared.infrastructure.metrics import record_message_published
 
 
 logger = logging.getLogger(__name__)
 
+# Route different event types to different queues
+_QUEUE_MAPPING = {
+    "user_created": "user_events",
+    "user_updated": "user_events",
+    "user_deleted": "user_events",
+}
+_DEFAULT_QUEUE = "domain_events"
+
+
+def _occurred_at(event: DomainEvent) -> str:
+    """Format occurred_at as the ISO 8601 string both codecs send, naive times being UTC."""
+    occurred_at = event.occurred_at
+    if occurred_at.tzinfo is None:
+        occurred_at = occurred_at.replace(tzinfo=timezone.utc)
+    return occurred_at.isoformat()
+
+
+def _to_json(event: DomainEvent) -> bytes:
+    """Encode an event as a UTF-8 JSON object, sent as application/json."""
+    return orjson.dumps({
+        "event_id": event.event_id,
+        "event_type": event.event_type,
+        "data": event.data,
+        "occurred_at": _occurred_at(event)
+    }, option=orjson.OPT_NAIVE_UTC)
+
+
+def _to_msgpack(event: DomainEvent) -> bytes:
+    """Encode an event as a MessagePack map, sent as application/msgpack."""
+    return msgpack.packb({
+        "event_id": event.event_id,
+        "event_type": event.event_type,
+        "data": event.data,
+        "occurred_at": _occurred_at(event)
+    }, use_bin_type=True)
+
+
+_CODECS = {
+    "json": (_to_json, JSON_CONTENT_TYPE),
+    "msgpack": (_to_msgpack, MSGPACK_CONTENT_TYPE),
+}
+
+
+def _select_codec(name: str) -> Tuple[Callable[[DomainEvent], bytes], str]:
+    """Get the serializer and content type of a codec by name."""
+    try:
+        return _CODECS[name]
+    except KeyError:
+        raise ValueError(
+            f"Invalid EVENTBUS_CODEC {name!r}, expected one of: {', '.join(_CODECS)}"
+        ) from None
+
+
+# Wire format for event bodies, "json" or "msgpack"
+_serialize, _CONTENT_TYPE = _select_codec(os.getenv("EVENTBUS_CODEC", "json"))
+
+# Encoded bodies keyed by event, so an event published again is not re-encoded
+_encoded_events: "weakref.WeakKeyDictionary[DomainEvent, bytes]" = weakref.WeakKeyDictionary()
+
+
+def _encode_event(event: DomainEvent) -> bytes:
+    """Serialize a domain event to its message body, once per event."""
+    body = _encoded_events.get(event)
+    if body is None:
+        body = _serialize(event)
+        _encoded_events[event] = body
+    return body
+
+
+class OutboxQueue:
+    """Bounded in-memory queue of events drained by a background task.
+    
+    Events put on the queue are collected into batches of up to max_batch,
+    waiting at most flush_interval seconds for a batch to fill, and handed to
+    flush. A batch that fails to publish is retried with exponential backoff
+    until it goes out or the queue is closed. Events still queued when the
+    process dies are lost; use a transactional outbox table where that matters.
+    """
+    
+    def __init__(
+        self,
+        flush: Callable[[List[DomainEvent]], Awaitable[None]],
+        maxsize: int = 10_000,
+        max_batch: int = 64,
+        flush_interval: float = 0.005,
+        retry_delay: float = 0.5,
+        max_retry_delay: float = 30.0
+    ):
+        self.queue: "asyncio.Queue[DomainEvent]" = asyncio.Queue(maxsize)
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self._flush = flush
+        # Events taken off the queue but not published yet
+        self._batch: List[DomainEvent] = []
+        self._flushing = False
+        self._stopping = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._drain())
+    
+    def put_nowait(self, event: DomainEvent) -> None:
+        """Queue an event, raising asyncio.QueueFull when the queue is full."""
+        self.queue.put_nowait(event)
+    
+    def _take_ready(self, batch: List[DomainEvent]) -> None:
+        """Move already queued events into the batch without waiting."""
+        while len(batch) < self.max_batch and not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+    
+    async def _drain(self) -> None:
+        while not self._stopping.is_set():
+            self._batch = [await self.queue.get()]
+            self._take_ready(self._batch)
+            if len(self._batch) < self.max_batch:
+                # Give events raised right after this one a chance to join the batch
+                await asyncio.sleep(self.flush_interval)
+                self._take_ready(self._batch)
+            self._flushing = True
+            try:
+                if await self._flush_with_retry(self._batch):
+                    self._batch = []
+            finally:
+                self._flushing = False
+    
+    async def _flush_with_retry(self, batch: List[DomainEvent]) -> bool:
+        """Publish a batch, retrying until it succeeds or the queue is closing."""
+        delay = self.retry_delay
+        while True:
+            try:
+                await self._flush(batch)
+                return True
+            except Exception as e:
+                logger.error("Failed to publish %s queued events, retrying in %ss: %s", len(batch), delay, e)
+            # Sleep before retrying, but wake up as soon as close() is called
+            try:
+                await asyncio.wait_for(self._stopping.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+            if self._stopping.is_set():
+                return False
+            delay = min(delay * 2, self.max_retry_delay)
+    
+    async def close(self) -> None:
+        """Stop draining and publish whatever is still queued.
+        
+        A publish already in progress is allowed to finish. Events that could
+        not be published are tried once more here, and the error is raised if
+        that fails too.
+        """
+        self._stopping.set()
+        if self._flushing:
+            # The drain loop exits once the current publish (or retry) is done
+            await self._task
+        else:
+            # Idle or still collecting a batch, which stays in self._batch
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        batch, self._batch = self._batch, []
+        while not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+        if batch:
+            await self._flush(batch)
+
 
 class RabbitMQEventBus(EventBus):
     """RabbitMQ implementation of EventBus."""
     
+    # Every queue _get_queue_name can route to
+    QUEUES = tuple(dict.fromkeys([*_QUEUE_MAPPING.values(), _DEFAULT_QUEUE]))
+    
     def __init__(self):
-        self.broker = RabbitMQBroker()
+        self.broker = get_broker()
+        # Created by start() on the application's event loop
+        self._outbox: Optional[OutboxQueue] = None
+    
+    def start(self) -> None:
+        """Publish through a background outbox, from the running event loop.
+        
+        Call from the application's startup hook and pair with close(). Until
+        then, and on any other event loop, publish() publishes inline.
+        """
+        if self._outbox is None:
+            self._outbox = OutboxQueue(self._publish_now)
+    
+    async def declare_queues(self) -> None:
+        """Declare the event queues up front so publishes skip the declare round trip."""
+        await self.broker.declare_queues(self.QUEUES)
     
     async def publish(self, events: List[DomainEvent]) -> None:
-        """Publish domain events to RabbitMQ."""
+        """Queue domain events for publishing to RabbitMQ.
+        
+        Once started, callers don't wait on the broker: events go to the
+        outbox and are published by its background task. When the outbox is
+        full, or the bus was not started, events are published inline instead.
+        """
+        if self._outbox is None:
+            await self._publish_now(events)
+            return
+        
+        overflow = []
         for event in events:
             try:
-                message = {
-                    "event_id": event.event_id,
-                    "event_type": event.event_type,
-                    "data": event.data,
-                    "occurred_at": event.occurred_at.isoformat()
-                }
-                
-                # Route events to appropriate queues based on event type
-                queue_name = self._get_queue_name(event.event_type)
-                await self.broker.publish(queue_name, message)
-                
-                # Record metrics
-                record_message_published(queue_name, "success")
-                logger.info(f"Published event {event.event_type} to queue {queue_name}")
-                
-            except Exception as e:
-                # Record failed publish metrics
-                queue_name = self._get_queue_name(event.event_type)
-                record_message_published(queue_name, "error")
-                logger.error(f"Failed to publish event {event.event_type}: {e}")
-                raise
+                self._outbox.put_nowait(event)
+            except asyncio.QueueFull:
+                overflow.append(event)
+        if overflow:
+            await self._publish_now(overflow)
+    
+    async def close(self) -> None:
+        """Stop the outbox, publishing any events still waiting in it."""
+        if self._outbox is not None:
+            outbox, self._outbox = self._outbox, None
+            await outbox.close()
+    
+    async def _publish_now(self, events: List[DomainEvent]) -> None:
+        """Publish domain events to RabbitMQ.
+        
+        Events are grouped by destination queue and each group goes out as one
+        batch, with all batches published concurrently.
+        """
+        # Route events to appropriate queues based on event type
+        routed = sorted(
+            ((self._get_queue_name(event.event_type), _encode_event(event)) for event in events),
+            key=itemgetter(0)
+        )
+        await asyncio.gather(*(
+            self._publish_batch(queue_name, [body for _, body in group])
+            for queue_name, group in groupby(routed, key=itemgetter(0))
+        ))
+    
+    async def _publish_batch(self, queue_name: str, bodies: List[bytes]) -> None:
+        """Publish one queue's events and record metrics for them."""
+        try:
+            await self.broker.publish_batch(queue_name, bodies, _CONTENT_TYPE)
+        except Exception as e:
+            # Record failed publish metrics
+            record_message_published(queue_name, "error", len(bodies))
+            logger.error("Failed to publish %s events to queue %s: %s", len(bodies), queue_name, e)
+            raise
+        
+        # Record metrics
+        record_message_published(queue_name, "success", len(bodies))
+        logger.debug("Published %s events to queue %s", len(bodies), queue_name)
     
     def _get_queue_name(self, event_type: str) -> str:
         """Get queue name based on event type."""
-        # Route different event types to different queues
-        queue_mapping = {
-            "user_created": "user_events",
-            "user_updated": "user_events",
-            "user_deleted": "user_events",
-        }
-        
-        return queue_mapping.get(event_type, "domain_events") 
\ No newline at end of file
+        return _QUEUE_MAPPING.get(event_type, _DEFAULT_QUEUE)
@@ -1,13 +1,39 @@
-import pika
-import json
+import asyncio
+import aio_pika
+import msgpack
+import orjson
 import os
-from typing import Callable, Any
+import zstandard
+from aio_pika.abc import AbstractChannel, AbstractRobustConnection
+from aio_pika.pool import Pool
+from functools import lru_cache, partial
+from typing import Awaitable, Callable, Iterable, List, Optional, Set
 from abc import ABC, abstractmethod
+from yarl import URL
 import logging
 
 
 logger = logging.getLogger(__name__)
 
+# Bodies at least this large are zstd-compressed before publishing
+_COMPRESSION_THRESHOLD = int(os.getenv("EVENTBUS_COMPRESSION_THRESHOLD", "4096"))
+_COMPRESSION_LEVEL = int(os.getenv("EVENTBUS_COMPRESSION_LEVEL", "2"))
+_ZSTD_ENCODING = "zstd"
+_compressor = zstandard.ZstdCompressor(level=_COMPRESSION_LEVEL)
+_decompressor = zstandard.ZstdDecompressor()
+
+# Body codecs, chosen by the message's content_type; untyped bodies are JSON
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+_DECODERS = {
+    JSON_CONTENT_TYPE: orjson.loads,
+    MSGPACK_CONTENT_TYPE: partial(msgpack.unpackb, raw=False),
+}
+
+# Publisher channels kept open per broker, and the AMQP heartbeat used unless RABBITMQ_URL sets one
+_AMQP_CHANNELS = int(os.getenv("AMQP_CHANNELS", "10"))
+_AMQP_HEARTBEAT_SECONDS = int(os.getenv("AMQP_HEARTBEAT_SECONDS", "30"))
+
 
 class MessageBroker(ABC):
     """Abstract message broker interface."""
@@ -18,80 +44,167 @@ class MessageBroker(ABC):
         pass
     
     @abstractmethod
-    async def consume(self, queue_name: str, callback: Callable[[dict], None]) -> None:
+    async def consume(self, queue_name: str, callback: Callable[[dict], Awaitable[None]]) -> None:
         """Consume messages from a queue."""
         pass
 
 
 class RabbitMQBroker(MessageBroker):
-    """RabbitMQ implementation of message broker."""
+    """RabbitMQ implementation of message broker.
     
-    def __init__(self):
+    Uses aio-pika so publishing never blocks the event loop. Connections and
+    channels are pooled and created on first use; each concurrent publisher
+    gets its own channel.
+    """
+    
+    def __init__(self, max_connections: int = 2, max_channels: int = _AMQP_CHANNELS, confirm_window: int = 10):
         self.connection_url = os.getenv("RABBITMQ_URL")
-        self.connection = None
-        self.channel = None
-        self._connect()
+        self.max_connections = max_connections
+        self.max_channels = max_channels
+        # Unconfirmed publishes allowed in flight per batch
+        self.confirm_window = confirm_window
+        self.connection_pool: Optional[Pool] = None
+        self.channel_pool: Optional[Pool] = None
+        # Queues already declared by this broker, declaring is idempotent but costs a round trip
+        self._declared: Set[str] = set()
+    
+    def _ensure_pools(self) -> None:
+        """Create the connection and channel pools on first use."""
+        if self.channel_pool is None:
+            self.connection_pool = Pool(self._make_connection, max_size=self.max_connections)
+            self.channel_pool = Pool(self._make_channel, max_size=self.max_channels)
     
-    def _connect(self):
+    async def _make_connection(self) -> AbstractRobustConnection:
         """Establish connection to RabbitMQ."""
+        url = URL(self.connection_url)
+        if "heartbeat" not in url.query:
+            url = url.update_query(heartbeat=_AMQP_HEARTBEAT_SECONDS)
         try:
-            parameters = pika.URLParameters(self.connection_url)
-            self.connection = pika.BlockingConnection(parameters)
-            self.channel = self.connection.channel()
-            logger.info("Connected to RabbitMQ")
+            connection = await aio_pika.connect_robust(url)
         except Exception as e:
-            logger.error(f"Failed to connect to RabbitMQ: {e}")
+            logger.error("Failed to connect to RabbitMQ: %s", e)
             raise
+        logger.info("Connected to RabbitMQ")
+        return connection
+    
+    async def _make_channel(self) -> AbstractChannel:
+        """Open a channel on a pooled connection."""
+        async with self.connection_pool.acquire() as connection:
+            return await connection.channel()
+    
+    async def _declare_queue(self, channel: AbstractChannel, queue_name: str) -> None:
+        """Declare a durable queue once per broker."""
+        if queue_name not in self._declared:
+            await channel.declare_queue(queue_name, durable=True)
+            self._declared.add(queue_name)
+    
+    async def declare_queues(self, queue_names: Iterable[str]) -> None:
+        """Declare queues ahead of the first publish, e.g. at startup."""
+        self._ensure_pools()
+        async with self.channel_pool.acquire() as channel:
+            for queue_name in queue_names:
+                await self._declare_queue(channel, queue_name)
+    
+    @staticmethod
+    def _message(body: bytes, content_type: str = JSON_CONTENT_TYPE) -> aio_pika.Message:
+        """Wrap a body in a persistent message, compressing large bodies."""
+        content_encoding = None
+        if len(body) >= _COMPRESSION_THRESHOLD:
+            body = _compressor.compress(body)
+            content_encoding = _ZSTD_ENCODING
+        return aio_pika.Message(
+            body=body,
+            content_type=content_type,
+            content_encoding=content_encoding,
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,  # Make message persistent
+        )
     
     async def publish(self, queue_name: str, message: dict) -> None:
         """Publish a message to a queue."""
+        await self.publish_raw(queue_name, orjson.dumps(message))
+    
+    async def publish_raw(self, queue_name: str, body: bytes, content_type: str = JSON_CONTENT_TYPE) -> None:
+        """Publish an already encoded message to a queue."""
         try:
-            if not self.channel:
-                self._connect()
-            
-            self.channel.queue_declare(queue=queue_name, durable=True)
-            
-            self.channel.basic_publish(
-                exchange='',
-                routing_key=queue_name,
-                body=json.dumps(message),
-                properties=pika.BasicProperties(
-                    delivery_mode=2,  # Make message persistent
-                )
-            )
-            logger.info(f"Published message to {queue_name}: {message}")
+            self._ensure_pools()
+            async with self.channel_pool.acquire() as channel:
+                await self._declare_queue(channel, queue_name)
+                await channel.default_exchange.publish(self._message(body, content_type), routing_key=queue_name)
+            logger.debug("Published message to %s (%s bytes)", queue_name, len(body))
         except Exception as e:
-            logger.error(f"Failed to publish message: {e}")
+            logger.error("Failed to publish message: %s", e)
             raise
     
-    async def consume(self, queue_name: str, callback: Callable[[dict], None]) -> None:
-        """Consume messages from a queue."""
+    async def publish_batch(
+        self, queue_name: str, bodies: List[bytes], content_type: str = JSON_CONTENT_TYPE
+    ) -> None:
+        """Publish several encoded messages to a queue on one channel.
+        
+        Channels use publisher confirms, so each publish resolves once the
+        broker confirms it. Up to confirm_window publishes are kept in flight
+        instead of waiting for every confirm in turn.
+        """
         try:
-            if not self.channel:
-                self._connect()
-            
-            self.channel.queue_declare(queue=queue_name, durable=True)
-            
-            def wrapper(ch, method, properties, body):
-                try:
-                    message = json.loads(body)
-                    callback(message)
-                    ch.basic_ack(delivery_tag=method.delivery_tag)
-                except Exception as e:
-                    logger.error(f"Error processing message: {e}")
-                    ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
-            
-            self.channel.basic_qos(prefetch_count=1)
-            self.channel.basic_consume(queue=queue_name, on_message_callback=wrapper)
+            self._ensure_pools()
+            async with self.channel_pool.acquire() as channel:
+                await self._declare_queue(channel, queue_name)
+                exchange = channel.default_exchange
+                window = asyncio.Semaphore(self.confirm_window)
+                
+                async def publish_one(body: bytes) -> None:
+                    async with window:
+                        await exchange.publish(self._message(body, content_type), routing_key=queue_name)
+                
+                await asyncio.gather(*(publish_one(body) for body in bodies))
+            logger.debug("Published %s messages to %s", len(bodies), queue_name)
+        except Exception as e:
+            logger.error("Failed to publish messages: %s", e)
+            raise
+    
+    async def consume(self, queue_name: str, callback: Callable[[dict], Awaitable[None]]) -> None:
+        """Consume messages from a queue until cancelled."""
+        try:
+            self._ensure_pools()
+            # A consumer holds its channel for good, so it gets one outside the publisher pool
+            async with self.connection_pool.acquire() as connection:
+                channel = await connection.channel()
+            await channel.set_qos(prefetch_count=1)
+            queue = await channel.declare_queue(queue_name, durable=True)
+            self._declared.add(queue_name)
             
-            logger.info(f"Started consuming from {queue_name}")
-            self.channel.start_consuming()
+            logger.info("Started consuming from %s", queue_name)
+            async with queue.iterator() as messages:
+                async for delivery in messages:
+                    try:
+                        body = delivery.body
+                        if delivery.content_encoding == _ZSTD_ENCODING:
+                            body = _decompressor.decompress(body)
+                        decode = _DECODERS.get(delivery.content_type, orjson.loads)
+                        message = decode(body)
+                        await callback(message)
+                        await delivery.ack()
+                    except Exception as e:
+                        logger.error("Error processing message: %s", e)
+                        await delivery.reject(requeue=False)
         except Exception as e:
-            logger.error(f"Failed to consume messages: {e}")
+            logger.error("Failed to consume messages: %s", e)
             raise
     
-    def close(self):
-        """Close connection."""
-        if self.connection and not self.connection.is_closed:
-            self.connection.close()
-            logger.info("Closed RabbitMQ connection") 
\ No newline at end of file
+    async def close(self) -> None:
+        """Close pooled channels and connections."""
+        if self.channel_pool is not None:
+            await self.channel_pool.close()
+            await self.connection_pool.close()
+            self.channel_pool = None
+            self.connection_pool = None
+            logger.info("Closed RabbitMQ connection")
+
+
+@lru_cache(maxsize=None)
+def get_broker() -> RabbitMQBroker:
+    """Get the process-wide RabbitMQ broker.
+    
+    Connecting costs a TCP and AMQP handshake, so every event bus shares one
+    broker and its connection and channel pools.
+    """
+    return RabbitMQBroker()
@@ -1,5 +1,6 @@
 from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
 from typing import Dict, Any
+import os
 import time
 import logging
 from functools import wraps
@@ -145,31 +146,39 @@ query_processing_total = Counter(
 # HELPER FUNCTIONS
 # =============================================================================
 
+# Labelled children resolved so far, keyed by (metric, *label values).
+# prometheus_client keeps counters in process memory, so recording is just
+# an increment once the child has been resolved. Bounded so that unexpected
+# label values cannot grow it without limit.
+_MAX_CACHED_CHILDREN = 10_000
+_child_cache: Dict[tuple, Any] = {}
+
+
+def _child(metric, *label_values):
+    """Get the child of a labelled metric, caching it by label values."""
+    key = (metric, *label_values)
+    child = _child_cache.get(key)
+    if child is None:
+        child = metric.labels(*label_values)
+        if len(_child_cache) < _MAX_CACHED_CHILDREN:
+            _child_cache[key] = child
+    return child
+
+
 def record_http_request(method: str, endpoint: str, status_code: int, duration: float):
     """Record HTTP request metrics."""
-    http_requests_total.labels(
-        method=method,
-        endpoint=endpoint,
-        status_code=status_code
-    ).inc()
-    
-    http_request_duration_seconds.labels(
-        method=method,
-        endpoint=endpoint
-    ).observe(duration)
+    _child(http_requests_total, method, endpoint, status_code).inc()
+    _child(http_request_duration_seconds, method, endpoint).observe(duration)
 
 
 def record_user_operation(operation: str, status: str):
     """Record user operation metrics."""
-    user_operations_total.labels(
-        operation=operation,
-        status=status
-    ).inc()
+    _child(user_operations_total, operation, status).inc()
 
 
 def record_auth_attempt(status: str):
     """Record authentication attempt metrics."""
-    auth_attempts_total.labels(status=status).inc()
+    _child(auth_attempts_total, status).inc()
 
 
 def record_jwt_token_issued():
@@ -179,57 +188,35 @@ def record_jwt_token_issued():
 
 def record_db_operation(operation: str, table: str, status: str, duration: float = None):
     """Record database operation metrics."""
-    db_operations_total.labels(
-        operation=operation,
-        table=table,
-        status=status
-    ).inc()
+    _child(db_operations_total, operation, table, status).inc()
     
     if duration is not None:
-        db_operation_duration_seconds.labels(
-            operation=operation,
-            table=table
-        ).observe(duration)
+        _child(db_operation_duration_seconds, operation, table).observe(duration)
 
 
-def record_message_published(queue: str, status: str):
+def record_message_published(queue: str, status: str, count: int = 1):
     """Record message published metrics."""
-    messages_published_total.labels(
-        queue=queue,
-        status=status
-    ).inc()
+    _child(messages_published_total, queue, status).inc(count)
 
 
 def record_message_consumed(queue: str, status: str):
     """Record message consumed metrics."""
-    messages_consumed_total.labels(
-        queue=queue,
-        status=status
-    ).inc()
+    _child(messages_consumed_total, queue, status).inc()
 
 
 def record_application_error(error_type: str, component: str):
     """Record application error metrics."""
-    application_errors_total.labels(
-        error_type=error_type,
-        component=component
-    ).inc()
+    _child(application_errors_total, error_type, component).inc()
 
 
 def record_command_processing(command_type: str, status: str):
     """Record command processing metrics."""
-    command_processing_total.labels(
-        command_type=command_type,
-        status=status
-    ).inc()
+    _child(command_processing_total, command_type, status).inc()
 
 
 def record_query_processing(query_type: str, status: str):
     """Record query processing metrics."""
-    query_processing_total.labels(
-        query_type=query_type,
-        status=status
-    ).inc()
+    _child(query_processing_total, query_type, status).inc()
 
 
 def update_active_users_count(count: int):
@@ -239,12 +226,27 @@ def update_active_users_count(count: int):
 
 def update_queue_depth(queue: str, depth: int):
     """Update queue depth metric."""
-    queue_depth.labels(queue=queue).set(depth)
+    _child(queue_depth, queue).set(depth)
 
 
-def get_metrics() -> str:
-    """Get all metrics in Prometheus format."""
-    return generate_latest()
+# Scrapes closer together than this share one rendered payload
+_METRICS_CACHE_SECONDS = float(os.getenv("METRICS_CACHE_SECONDS", "1.0"))
+_metrics_cache = (float("-inf"), b"")
+
+
+def get_metrics() -> bytes:
+    """Get all metrics in Prometheus format.
+    
+    Rendering walks every collector, so the output is reused for scrapes
+    that arrive within _METRICS_CACHE_SECONDS of each other.
+    """
+    global _metrics_cache
+    rendered_at, payload = _metrics_cache
+    now = time.monotonic()
+    if now - rendered_at >= _METRICS_CACHE_SECONDS:
+        payload = generate_latest()
+        _metrics_cache = (now, payload)
+    return payload
 
 
 def get_content_type() -> str:
@@ -261,7 +263,7 @@ def monitor_endpoint(endpoint_name: str = None):
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             http_requests_in_progress.inc()
             
             try:
@@ -277,7 +279,7 @@ def monitor_endpoint(endpoint_name: str = None):
                 )
                 raise
             finally:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 http_requests_in_progress.dec()
                 
                 # Try to get method from request context or default to 'unknown'
@@ -336,19 +338,19 @@ def monitor_db_operation(operation: str, table: str):
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
+            status = 'error'
             try:
                 result = await func(*args, **kwargs)
-                duration = time.time() - start_time
-                record_db_operation(operation, table, 'success', duration)
+                status = 'success'
                 return result
             except Exception as e:
-                duration = time.time() - start_time
-                record_db_operation(operation, table, 'error', duration)
                 record_application_error(
                     error_type=type(e).__name__,
                     component='database'
                 )
                 raise
+            finally:
+                record_db_operation(operation, table, status, time.perf_counter() - start_time)
         return wrapper
     return decorator 
\ No newline at end of file
@@ -1,88 +1,109 @@
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from src.shared.infrastructure.metrics import record_http_request
+from functools import lru_cache
+import os
+import re
 import time
 import logging
 
 
 logger = logging.getLogger(__name__)
 
+# Durations are already exported to Prometheus, echoing them per response is opt-in
+_EMIT_RESPONSE_TIME_HEADER = os.getenv("EMIT_RESPONSE_TIME_HEADER", "false").lower() == "true"
 
-class PrometheusMiddleware(BaseHTTPMiddleware):
-    """Middleware to automatically record HTTP metrics for all requests."""
+
+class PrometheusMiddleware:
+    """Middleware to automatically record HTTP metrics for all requests.
+    
+    Plain ASGI middleware: method and path are read from the scope and the
+    status from the response start message, without the extra task and
+    request wrapping BaseHTTPMiddleware adds per request.
+    """
     
     def __init__(self, app: ASGIApp):
-        super().__init__(app)
+        self.app = app
     
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and record metrics."""
-        start_time = time.time()
-        method = request.method
-        path = request.url.path
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        start_time = time.perf_counter()
+        method = scope["method"]
+        path = scope["path"]
         
         # Clean up the path for metrics (remove query params and specific IDs)
         endpoint = self._normalize_endpoint(path)
         
+        # Failed requests are recorded as 500s
+        status_code = 500
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add response headers with metrics info
+                if _EMIT_RESPONSE_TIME_HEADER:
+                    duration = time.perf_counter() - start_time
+                    MutableHeaders(scope=message).append("X-Response-Time", f"{duration * 1000:.1f}ms")
+            await send(message)
+        
         try:
-            response = await call_next(request)
-            status_code = response.status_code
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            # Record error metrics
-            duration = time.time() - start_time
-            record_http_request(method, endpoint, 500, duration)
-            logger.error(f"Request failed: {method} {path} - {str(e)}")
+            logger.error("Request failed: %s %s - %s", method, path, e)
             raise
-        
-        # Record successful request metrics
-        duration = time.time() - start_time
-        record_http_request(method, endpoint, status_code, duration)
-        
-        # Add response headers with metrics info
-        response.headers["X-Response-Time"] = str(duration)
-        
-        return response
+        finally:
+            record_http_request(method, endpoint, status_code, time.perf_counter() - start_time)
     
     def _normalize_endpoint(self, path: str) -> str:
         """Normalize endpoint path for metrics to avoid high cardinality."""
-        # Remove trailing slash
-        if path.endswith('/') and len(path) > 1:
-            path = path[:-1]
-        
-        # Replace UUIDs and numeric IDs with placeholders
-        import re
-        
-        # Replace UUIDs (e.g., /api/v1/users/123e4567-e89b-12d3-a456-426614174000)
-        path = re.sub(
-            r'/[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}',
-            '/{id}',
-            path,
-            flags=re.IGNORECASE
-        )
-        
-        # Replace numeric IDs (e.g., /api/v1/users/123)
-        path = re.sub(r'/\d+', '/{id}', path)
-        
-        # Keep meaningful endpoints, generalize others
-        known_endpoints = [
-            '/api/v1/users',
-            '/api/v1/users/{id}',
-            '/api/v1/auth/login',
-            '/api/v1/auth/verify',
-            '/api/v1/auth/refresh',
-            '/',
-            '/health',
-            '/metrics',
-            '/docs',
-            '/redoc',
-            '/openapi.json'
-        ]
-        
-        if path in known_endpoints:
-            return path
-        
-        # For unknown endpoints, use a generic label
-        if path.startswith('/api/'):
-            return '/api/unknown'
-        
-        return '/unknown' 
\ No newline at end of file
+        return _normalize_path(path)
+
+
+# Replace UUIDs (e.g., /api/v1/users/123e4567-e89b-12d3-a456-426614174000)
+_UUID_RE = re.compile(
+    r'/[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}',
+    re.IGNORECASE
+)
+
+# Replace numeric IDs (e.g., /api/v1/users/123)
+_NUMERIC_ID_RE = re.compile(r'/\d+')
+
+# Keep meaningful endpoints, generalize others
+_KNOWN_ENDPOINTS = frozenset({
+    '/api/v1/users',
+    '/api/v1/users/{id}',
+    '/api/v1/auth/login',
+    '/api/v1/auth/verify',
+    '/api/v1/auth/refresh',
+    '/',
+    '/health',
+    '/metrics',
+    '/docs',
+    '/redoc',
+    '/openapi.json'
+})
+
+
+@lru_cache(maxsize=2048)
+def _normalize_path(path: str) -> str:
+    """Map a request path to its metrics label; real traffic repeats paths, so results are cached."""
+    # Remove trailing slash
+    if path.endswith('/') and len(path) > 1:
+        path = path[:-1]
+    
+    path = _UUID_RE.sub('/{id}', path)
+    path = _NUMERIC_ID_RE.sub('/{id}', path)
+    
+    if path in _KNOWN_ENDPOINTS:
+        return path
+    
+    # For unknown endpoints, use a generic label
+    if path.startswith('/api/'):
+        return '/api/unknown'
+    
+    return '/unknown'
\ No newline at end of file
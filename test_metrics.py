@@ -3,30 +3,92 @@
 Script para generar tráfico y probar las métricas del sistema.
 """
 
-import requests
-import time
-import json
+import argparse
+import asyncio
+import httpx
+import itertools
+import logging
+import orjson
+import queue
+import re
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import threading
+from logging.handlers import QueueHandler, QueueListener
+
+logger = logging.getLogger("metrics_test")
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Pruebas que se pueden lanzar con --mode
+MODES = ("traffic", "users", "auth", "stress", "metrics", "all")
+
+# Métricas importantes: muestras (no comentarios) de estas familias
+IMPORTANT_METRICS = (
+    'http_requests_total',
+    'user_operations_total',
+    'auth_attempts_total',
+    'db_operations_total',
+    'application_errors_total'
+)
+_METRIC_RE = re.compile(r"(?:%s)\b" % "|".join(map(re.escape, IMPORTANT_METRICS)))
+
 
 class MetricsTestGenerator:
-    def __init__(self, base_url="http://localhost:8000"):
+    def __init__(self, base_url="http://localhost:8000", max_connections=128, max_keepalive=32, http2=False):
         self.base_url = base_url
-        self.session = requests.Session()
+        # Un solo pool keep-alive compartido por todas las pruebas, sin reintentos.
+        # Los límites van en el transporte: con transport= httpx ignora los del cliente.
+        # HTTP/2 es opcional (requiere httpx[http2]): uvicorn solo habla HTTP/1.1,
+        # así que solo sirve detrás de un proxy con TLS que lo negocie.
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            follow_redirects=True,
+            transport=httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive
+                ),
+                retries=0,
+                http2=http2
+            )
+        )
+    
+    async def close(self):
+        """Cerrar las conexiones del cliente."""
+        await self.client.aclose()
         
-    def health_check(self):
+    async def health_check(self):
         """Verificar que la API esté funcionando."""
         try:
-            response = self.session.get(f"{self.base_url}/health")
+            response = await self.client.get("/health")
             return response.status_code == 200
         except Exception as e:
-            print(f"❌ Error en health check: {e}")
+            logger.error("❌ Error en health check: %s", e)
+            return False
+    
+    async def _get(self, endpoint):
+        """Hacer un GET y reportar su resultado."""
+        try:
+            response = await self.client.get(endpoint)
+            logger.info("📊 %s -> %s", endpoint, response.status_code)
+            return True
+        except Exception as e:
+            logger.error("❌ Error: %s", e)
             return False
     
-    def generate_http_traffic(self, duration=30):
+    async def _run_for(self, duration, workers):
+        """Ejecutar workers infinitos hasta que venza el plazo y cancelarlos."""
+        tasks = [asyncio.create_task(worker) for worker in workers]
+        try:
+            await asyncio.wait_for(asyncio.gather(*tasks), timeout=duration)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def generate_http_traffic(self, duration=30):
         """Generar tráfico HTTP básico."""
-        print(f"🌐 Generando tráfico HTTP por {duration} segundos...")
+        logger.info("🌐 Generando tráfico HTTP por %s segundos...", duration)
         
         endpoints = [
             "/health",
@@ -34,52 +96,59 @@ class MetricsTestGenerator:
             "/api/v1/users",  # Esto dará 405 pero genera métricas
         ]
         
-        start_time = time.time()
         requests_count = 0
         
-        while time.time() - start_time < duration:
-            for endpoint in endpoints:
-                try:
-                    response = self.session.get(f"{self.base_url}{endpoint}")
-                    requests_count += 1
-                    print(f"📊 {endpoint} -> {response.status_code}")
-                except Exception as e:
-                    print(f"❌ Error: {e}")
+        async def traffic():
+            nonlocal requests_count
+            while True:
+                # Los endpoints son independientes, se piden en paralelo
+                results = await asyncio.gather(*(self._get(endpoint) for endpoint in endpoints))
+                requests_count += sum(results)
                 
-                time.sleep(0.5)
+                await asyncio.sleep(0.5)
         
-        print(f"✅ Generadas {requests_count} requests en {duration} segundos")
+        await self._run_for(duration, [traffic()])
+        logger.info("✅ Generadas %s requests en %s segundos", requests_count, duration)
     
-    def create_test_users(self, count=5):
-        """Crear usuarios de prueba."""
-        print(f"👥 Creando {count} usuarios de prueba...")
+    async def create_test_users(self, count=5, max_concurrency=10):
+        """Crear usuarios de prueba en paralelo."""
+        logger.info("👥 Creando %s usuarios de prueba...", count)
+        
+        # Limita cuántos registros llegan a la vez al servidor
+        semaphore = asyncio.Semaphore(max_concurrency)
         
-        for i in range(count):
-            user_data = {
+        # Cuerpos ya codificados antes de lanzar las peticiones
+        payloads = [
+            orjson.dumps({
                 "email": f"test{i}@example.com",
                 "username": f"testuser{i}",
                 "first_name": f"Test{i}",
                 "last_name": f"User{i}",
                 "password": "password123"
-            }
-            
+            })
+            for i in range(count)
+        ]
+        
+        async def create_user(i, payload):
             try:
-                response = self.session.post(
-                    f"{self.base_url}/api/v1/users",
-                    json=user_data
-                )
+                async with semaphore:
+                    response = await self.client.post(
+                        "/api/v1/users",
+                        content=payload,
+                        headers=JSON_HEADERS
+                    )
                 if response.status_code == 201:
-                    print(f"✅ Usuario {i+1} creado exitosamente")
+                    logger.info("✅ Usuario %s creado exitosamente", i+1)
                 else:
-                    print(f"⚠️ Usuario {i+1} falló: {response.status_code}")
+                    logger.warning("⚠️ Usuario %s falló: %s", i+1, response.status_code)
             except Exception as e:
-                print(f"❌ Error creando usuario {i+1}: {e}")
-            
-            time.sleep(1)
+                logger.error("❌ Error creando usuario %s: %s", i+1, e)
+        
+        await asyncio.gather(*(create_user(i, payload) for i, payload in enumerate(payloads)))
     
-    def test_authentication(self, attempts=10):
+    async def test_authentication(self, attempts=10):
         """Probar autenticación con diferentes credenciales."""
-        print(f"🔐 Probando autenticación con {attempts} intentos...")
+        logger.info("🔐 Probando autenticación con %s intentos...", attempts)
         
         # Credenciales de prueba (algunas correctas, algunas incorrectas)
         credentials = [
@@ -88,157 +157,234 @@ class MetricsTestGenerator:
             {"email": "nonexistent@example.com", "password": "password123"},  # No existe
             {"email": "test0@example.com", "password": "password123"},  # Correcto
         ]
+        # Cada credencial se codifica una sola vez y se reutiliza en los intentos
+        payloads = [orjson.dumps(creds) for creds in credentials]
         
         for i in range(attempts):
             creds = credentials[i % len(credentials)]
             
             try:
-                response = self.session.post(
-                    f"{self.base_url}/api/v1/auth/login",
-                    json=creds
+                response = await self.client.post(
+                    "/api/v1/auth/login",
+                    content=payloads[i % len(payloads)],
+                    headers=JSON_HEADERS
                 )
                 
                 if response.status_code == 200:
-                    print(f"✅ Login exitoso: {creds['email']}")
+                    logger.info("✅ Login exitoso: %s", creds['email'])
                 else:
-                    print(f"❌ Login fallido: {creds['email']} -> {response.status_code}")
+                    logger.info("❌ Login fallido: %s -> %s", creds['email'], response.status_code)
                     
             except Exception as e:
-                print(f"❌ Error en login: {e}")
+                logger.error("❌ Error en login: %s", e)
             
-            time.sleep(1)
+            await asyncio.sleep(1)
     
-    def stress_test(self, concurrent_users=5, duration=60):
-        """Prueba de estrés con múltiples usuarios concurrentes."""
-        print(f"🚀 Iniciando prueba de estrés: {concurrent_users} usuarios por {duration} segundos...")
-        
-        def user_session(user_id):
-            session = requests.Session()
-            start_time = time.time()
-            request_count = 0
-            
-            while time.time() - start_time < duration:
+    async def stress_test(self, concurrent_users=5, duration=60, delay=0.0):
+        """Prueba de estrés con múltiples usuarios concurrentes.
+        
+        Cada usuario mantiene tantas peticiones en vuelo como endpoints hay y,
+        en cuanto una termina, toma el siguiente endpoint de una cola de trabajo
+        compartida; así un endpoint lento no frena al resto. delay es la pausa
+        tras cada petición; con 0 solo se cede el event loop, sin esperar.
+        """
+        logger.info("🚀 Iniciando prueba de estrés: %s usuarios por %s segundos...", concurrent_users, duration)
+        
+        # Simular comportamiento de usuario
+        endpoints = [
+            "/health",
+            "/api/v1/users",
+            "/metrics"
+        ]
+        work = itertools.cycle(endpoints)
+        request_counts = [0] * concurrent_users
+        error_counts = [0] * concurrent_users
+        
+        async def request_stream(user_id):
+            # Todos los usuarios comparten el pool de conexiones del cliente
+            while True:
                 try:
-                    # Simular comportamiento de usuario
-                    endpoints = [
-                        "/health",
-                        "/api/v1/users",
-                        "/metrics"
-                    ]
-                    
-                    for endpoint in endpoints:
-                        response = session.get(f"{self.base_url}{endpoint}")
-                        request_count += 1
-                        time.sleep(0.1)
+                    await self.client.get(next(work))
+                    request_counts[user_id] += 1
+                except Exception:
+                    # Se cuentan en vez de registrarse: en plena carga inundarían la salida
+                    error_counts[user_id] += 1
                 
-                except Exception as e:
-                    pass
-                
-                time.sleep(0.5)
-            
-            return f"Usuario {user_id}: {request_count} requests"
+                await asyncio.sleep(delay)
         
-        # Ejecutar usuarios concurrentes
-        with ThreadPoolExecutor(max_workers=concurrent_users) as executor:
-            futures = [executor.submit(user_session, i) for i in range(concurrent_users)]
-            
-            for future in as_completed(futures):
-                result = future.result()
-                print(f"✅ {result}")
+        async def user_session(user_id):
+            # Las peticiones de un usuario viajan en paralelo (streams sobre HTTP/2)
+            await asyncio.gather(*(request_stream(user_id) for _ in endpoints))
+        
+        # Ejecutar usuarios concurrentes; el plazo los cancela a todos a la vez
+        await self._run_for(duration, [user_session(i) for i in range(concurrent_users)])
+        for user_id, (request_count, error_count) in enumerate(zip(request_counts, error_counts)):
+            logger.info("✅ Usuario %s: %s requests, %s errores", user_id, request_count, error_count)
     
-    def show_current_metrics(self):
+    async def show_current_metrics(self):
         """Mostrar métricas actuales."""
-        print("📈 Métricas actuales:")
+        logger.info("📈 Métricas actuales:")
         
         try:
-            response = self.session.get(f"{self.base_url}/metrics")
-            if response.status_code == 200:
-                metrics_lines = response.text.split('\n')
-                
-                # Filtrar métricas importantes
-                important_metrics = [
-                    'http_requests_total',
-                    'user_operations_total',
-                    'auth_attempts_total',
-                    'db_operations_total',
-                    'application_errors_total'
-                ]
-                
-                for line in metrics_lines:
-                    if any(metric in line for metric in important_metrics):
-                        if not line.startswith('#') and line.strip():
-                            print(f"  {line}")
-            else:
-                print(f"❌ Error obteniendo métricas: {response.status_code}")
+            # Se recorre el cuerpo en streaming, sin cargarlo entero en memoria
+            async with self.client.stream("GET", "/metrics") as response:
+                if response.status_code == 200:
+                    # Filtrar métricas importantes
+                    async for line in response.aiter_lines():
+                        if _METRIC_RE.match(line):
+                            logger.info("  %s", line)
+                else:
+                    logger.error("❌ Error obteniendo métricas: %s", response.status_code)
                 
         except Exception as e:
-            print(f"❌ Error: {e}")
+            logger.error("❌ Error: %s", e)
 
-def main():
-    """Función principal."""
-    print("🚀 Generador de Tráfico para Métricas")
-    print("=" * 50)
+def start_logging():
+    """Escribir la salida desde un hilo aparte.
     
-    generator = MetricsTestGenerator()
+    Los workers solo encolan cada registro; el QueueListener hace la escritura
+    bloqueante en stdout, fuera del event loop. Devuelve el listener, que hay
+    que detener para vaciar la cola.
+    """
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(log_queue, handler)
     
-    # Verificar conectividad
-    if not generator.health_check():
-        print("❌ La API no está disponible en http://localhost:8000")
-        sys.exit(1)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    listener.start()
+    return listener
+
+
+def parse_args(argv=None):
+    """Argumentos de línea de comandos; sin --mode se abre el menú interactivo."""
+    parser = argparse.ArgumentParser(description="Generador de tráfico para métricas")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="URL base de la API")
+    parser.add_argument("--mode", choices=MODES, help="prueba a ejecutar sin menú interactivo")
+    parser.add_argument("--duration", type=int, help="duración en segundos (tráfico: 30, estrés: 60)")
+    parser.add_argument("--count", type=int, default=5, help="usuarios a crear")
+    parser.add_argument("--attempts", type=int, default=10, help="intentos de login")
+    parser.add_argument("--concurrency", type=int, default=5, help="usuarios concurrentes en la prueba de estrés")
+    parser.add_argument("--delay", type=float, default=0.0, help="pausa entre peticiones en la prueba de estrés")
+    parser.add_argument("--http2", action="store_true", help="usar HTTP/2 (requiere httpx[http2])")
+    return parser.parse_args(argv)
+
+
+async def main(args, listener):
+    """Función principal."""
+    logger.info("🚀 Generador de Tráfico para Métricas")
+    logger.info("=" * 50)
     
-    print("✅ API disponible")
+    generator = MetricsTestGenerator(args.base_url, http2=args.http2)
+    try:
+        # Verificar conectividad
+        if not await generator.health_check():
+            logger.error("❌ La API no está disponible en %s", args.base_url)
+            sys.exit(1)
+        
+        if args.mode is None:
+            await run_menu(generator, listener)
+        else:
+            await run_mode(generator, args)
+    finally:
+        await generator.close()
+
+
+async def run_all(generator, duration=30):
+    """Secuencia completa: usuarios, autenticación, tráfico y métricas."""
+    logger.info("🚀 Ejecutando secuencia completa...")
+    await generator.create_test_users(3)
+    await asyncio.sleep(2)
+    await generator.test_authentication(8)
+    await asyncio.sleep(2)
+    await generator.generate_http_traffic(duration)
+    await asyncio.sleep(2)
+    await generator.show_current_metrics()
+
+
+async def run_mode(generator, args):
+    """Ejecutar la prueba elegida con --mode, sin interacción."""
+    if args.mode == "traffic":
+        await generator.generate_http_traffic(args.duration or 30)
+    elif args.mode == "users":
+        await generator.create_test_users(args.count)
+    elif args.mode == "auth":
+        await generator.test_authentication(args.attempts)
+    elif args.mode == "stress":
+        await generator.stress_test(args.concurrency, args.duration or 60, args.delay)
+    elif args.mode == "metrics":
+        await generator.show_current_metrics()
+    elif args.mode == "all":
+        await run_all(generator, args.duration or 30)
+
+
+def ask(listener, prompt):
+    """Leer una respuesta tras escribir los registros pendientes.
+    
+    El listener escribe desde su propio hilo; detenerlo vacía la cola, así el
+    prompt de input() no aparece antes del menú.
+    """
+    listener.stop()
+    try:
+        return input(prompt)
+    finally:
+        listener.start()
+
+
+async def run_menu(generator, listener):
+    """Menú interactivo sobre un generador ya creado."""
+    logger.info("✅ API disponible")
     
     # Mostrar opciones
-    print("\n📋 Opciones disponibles:")
-    print("1. Generar tráfico HTTP básico")
-    print("2. Crear usuarios de prueba")
-    print("3. Probar autenticación")
-    print("4. Prueba de estrés")
-    print("5. Mostrar métricas actuales")
-    print("6. Ejecutar todo automáticamente")
-    print("0. Salir")
+    logger.info("\n📋 Opciones disponibles:")
+    logger.info("1. Generar tráfico HTTP básico")
+    logger.info("2. Crear usuarios de prueba")
+    logger.info("3. Probar autenticación")
+    logger.info("4. Prueba de estrés")
+    logger.info("5. Mostrar métricas actuales")
+    logger.info("6. Ejecutar todo automáticamente")
+    logger.info("0. Salir")
     
     while True:
         try:
-            choice = input("\n👉 Selecciona una opción (0-6): ").strip()
+            choice = ask(listener, "\n👉 Selecciona una opción (0-6): ").strip()
             
             if choice == "0":
-                print("👋 ¡Hasta luego!")
+                logger.info("👋 ¡Hasta luego!")
                 break
             elif choice == "1":
-                duration = int(input("⏱️ Duración en segundos (default: 30): ") or 30)
-                generator.generate_http_traffic(duration)
+                duration = int(ask(listener, "⏱️ Duración en segundos (default: 30): ") or 30)
+                await generator.generate_http_traffic(duration)
             elif choice == "2":
-                count = int(input("👥 Número de usuarios (default: 5): ") or 5)
-                generator.create_test_users(count)
+                count = int(ask(listener, "👥 Número de usuarios (default: 5): ") or 5)
+                await generator.create_test_users(count)
             elif choice == "3":
-                attempts = int(input("🔐 Número de intentos (default: 10): ") or 10)
-                generator.test_authentication(attempts)
+                attempts = int(ask(listener, "🔐 Número de intentos (default: 10): ") or 10)
+                await generator.test_authentication(attempts)
             elif choice == "4":
-                users = int(input("👥 Usuarios concurrentes (default: 5): ") or 5)
-                duration = int(input("⏱️ Duración en segundos (default: 60): ") or 60)
-                generator.stress_test(users, duration)
+                users = int(ask(listener, "👥 Usuarios concurrentes (default: 5): ") or 5)
+                duration = int(ask(listener, "⏱️ Duración en segundos (default: 60): ") or 60)
+                await generator.stress_test(users, duration)
             elif choice == "5":
-                generator.show_current_metrics()
+                await generator.show_current_metrics()
             elif choice == "6":
-                print("🚀 Ejecutando secuencia completa...")
-                generator.create_test_users(3)
-                time.sleep(2)
-                generator.test_authentication(8)
-                time.sleep(2)
-                generator.generate_http_traffic(30)
-                time.sleep(2)
-                generator.show_current_metrics()
+                await run_all(generator)
             else:
-                print("❌ Opción no válida")
+                logger.warning("❌ Opción no válida")
                 
         except KeyboardInterrupt:
-            print("\n👋 Interrumpido por el usuario")
+            logger.info("\n👋 Interrumpido por el usuario")
             break
         except ValueError:
-            print("❌ Por favor ingresa un número válido")
+            logger.warning("❌ Por favor ingresa un número válido")
         except Exception as e:
-            print(f"❌ Error: {e}")
+            logger.error("❌ Error: %s", e)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    listener = start_logging()
+    try:
+        asyncio.run(main(parse_args(), listener))
+    finally:
+        listener.stop() 
\ No newline at end of file
@@ -1,19 +1,31 @@
 import pytest
+import pytest_asyncio
 import asyncio
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from src.shared.infrastructure.database import Base
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from src.shared.infrastructure.database import Base, get_db
 from src.contexts.users.infrastructure.models import UserModel
+from src.contexts.users.domain.services import PasswordService
+from src.main import app
 
 
-# Test database URL (in-memory SQLite for testing)
-TEST_DATABASE_URL = "sqlite:///./test.db"
+# Test database URL (file-backed SQLite for testing)
+TEST_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
 
-engine = create_engine(
-    TEST_DATABASE_URL,
-    connect_args={"check_same_thread": False}
-)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = create_async_engine(TEST_DATABASE_URL)
+
+
+# pysqlite manages transactions itself and breaks SAVEPOINT; let SQLAlchemy
+# emit BEGIN so each test can run inside one rolled-back transaction
+@event.listens_for(engine.sync_engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine.sync_engine, "begin")
+def _begin_transaction(connection):
+    connection.exec_driver_sql("BEGIN")
 
 
 @pytest.fixture(scope="session")
@@ -24,16 +36,44 @@ def event_loop():
     loop.close()
 
 
-@pytest.fixture(scope="function")
-def db_session():
-    """Create a database session for testing."""
-    Base.metadata.create_all(bind=engine)
-    db = TestingSessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-        Base.metadata.drop_all(bind=engine)
+@pytest_asyncio.fixture(scope="session")
+async def db_engine():
+    """Create the schema once for the test session."""
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    yield engine
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db_session(db_engine):
+    """Create a database session for testing, also used by the app.
+    
+    The session is bound to an outer transaction that is rolled back after the
+    test, and the app's get_db is overridden to hand out this session, so
+    nothing a test commits through the API persists.
+    """
+    async with db_engine.connect() as connection:
+        transaction = await connection.begin()
+        db = AsyncSession(
+            bind=connection,
+            autoflush=False,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint"
+        )
+        
+        async def override_get_db():
+            yield db
+        
+        app.dependency_overrides[get_db] = override_get_db
+        try:
+            yield db
+        finally:
+            app.dependency_overrides.pop(get_db, None)
+            await db.close()
+            await transaction.rollback()
 
 
 @pytest.fixture
@@ -45,4 +85,22 @@ def sample_user_data():
         "first_name": "Test",
         "last_name": "User",
         "password": "TestPassword123"
-    } 
\ No newline at end of file
+    } 
+
+
+@pytest.fixture(scope="session")
+def sample_hashes():
+    """Hashes of valid sample passwords, computed once per test session.
+    
+    bcrypt releases the GIL while hashing, so the passwords are hashed in
+    parallel threads.
+    """
+    service = PasswordService()
+    passwords = (
+        "TestPassword123",
+        "MySecurePassword1",
+        "ValidPass123",
+        "StrongPassword2024",
+    )
+    with ThreadPoolExecutor(max_workers=len(passwords)) as executor:
+        return dict(zip(passwords, executor.map(service.hash_password, passwords)))
\ No newline at end of file
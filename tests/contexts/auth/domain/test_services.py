@@ -0,0 +1,193 @@
+import pytest
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock, patch
+from jose import jwt
+from src.contexts.auth.domain import services
+from src.contexts.auth.domain.services import AuthService, TokenVerifier
+from src.contexts.users.domain.services import PasswordService
+from src.shared.domain.exceptions import UnauthorizedError
+
+
+@pytest.fixture
+def auth_service(monkeypatch):
+    """AuthService with a fixed signing configuration."""
+    monkeypatch.setattr(services, "_SECRET_KEY", "test-secret-key")
+    services._token_cache.clear()
+    yield AuthService(user_repository=None, password_service=PasswordService())
+    services._token_cache.clear()
+
+
+class TestAuthServiceVerifyToken:
+    """Test cases for AuthService token verification."""
+    
+    def test_verify_valid_token(self, auth_service):
+        """Test verifying a token issued by the service."""
+        token = auth_service._create_access_token({"sub": "user-1", "email": "test@example.com"})
+        
+        payload = auth_service.verify_token(token)
+        
+        assert payload["sub"] == "user-1"
+        assert payload["email"] == "test@example.com"
+    
+    def test_standalone_verifier_accepts_issued_token(self, auth_service):
+        """Test a TokenVerifier, which has no repository, verifies issued tokens."""
+        token = auth_service._create_access_token({"sub": "user-1", "email": "test@example.com"})
+        
+        payload = TokenVerifier().verify_token(token)
+        
+        assert payload["sub"] == "user-1"
+    
+    def test_verify_invalid_token(self, auth_service):
+        """Test verifying a malformed token raises UnauthorizedError."""
+        with pytest.raises(UnauthorizedError):
+            auth_service.verify_token("invalid-token")
+    
+    def test_verify_token_is_cached(self, auth_service):
+        """Test repeated verification of the same token decodes it only once."""
+        token = auth_service._create_access_token({"sub": "user-1", "email": "test@example.com"})
+        
+        with patch.object(auth_service, "_decode_token", wraps=auth_service._decode_token) as decode:
+            first = auth_service.verify_token(token)
+            second = auth_service.verify_token(token)
+        
+        assert first == second
+        assert decode.call_count == 1
+    
+    def test_invalidate_token(self, auth_service):
+        """Test invalidated tokens are decoded again on the next verification."""
+        token = auth_service._create_access_token({"sub": "user-1", "email": "test@example.com"})
+        auth_service.verify_token(token)
+        
+        auth_service.invalidate_token(token)
+        
+        with patch.object(auth_service, "_decode_token", wraps=auth_service._decode_token) as decode:
+            auth_service.verify_token(token)
+        
+        assert decode.call_count == 1
+    
+    def test_expired_cached_entry_is_not_served(self, auth_service):
+        """Test a cached payload is not served past the token expiry."""
+        token = auth_service._create_access_token({"sub": "user-1", "email": "test@example.com"})
+        payload = auth_service.verify_token(token)
+        
+        with patch.object(services.time, "time", return_value=payload["exp"] + 1), \
+                patch.object(auth_service, "_decode_token", wraps=auth_service._decode_token) as decode:
+            with pytest.raises(UnauthorizedError):
+                auth_service.verify_token(token)
+        
+        assert decode.call_count == 1
+
+
+class TestAuthServiceFastVerify:
+    """Test cases for the JWT verification fast path."""
+    
+    def test_issued_token_skips_jwt_decode(self, auth_service):
+        """Test tokens issued by the service are verified without jwt.decode."""
+        token = auth_service._create_access_token({"sub": "user-1", "email": "test@example.com"})
+        
+        with patch.object(services.jwt, "decode") as decode:
+            payload = auth_service._decode_token(token)
+        
+        assert payload == jwt.decode(token, services._SECRET_KEY, algorithms=["HS256"])
+        decode.assert_not_called()
+    
+    def test_tampered_payload_is_rejected(self, auth_service):
+        """Test a token whose payload was swapped fails signature verification."""
+        token = auth_service._create_access_token({"sub": "user-1", "email": "test@example.com"})
+        other = auth_service._create_access_token({"sub": "user-2", "email": "other@example.com"})
+        header, _, signature = token.split(".")
+        forged = ".".join([header, other.split(".")[1], signature])
+        
+        with pytest.raises(UnauthorizedError):
+            auth_service.verify_token(forged)
+    
+    @pytest.mark.parametrize("matching_bytes", [0, 1, 8, 16, 31])
+    def test_partially_matching_signature_is_rejected(self, auth_service, matching_bytes):
+        """Test signatures sharing a prefix with the real one are all rejected."""
+        token = auth_service._create_access_token({"sub": "user-1", "email": "test@example.com"})
+        header, payload, signature = token.split(".")
+        raw_signature = services._b64url_decode(signature)
+        forged = raw_signature[:matching_bytes] + bytes(
+            byte ^ 0xFF for byte in raw_signature[matching_bytes:]
+        )
+        forged_signature = services._b64url_encode(forged)
+        
+        with pytest.raises(UnauthorizedError):
+            auth_service.verify_token(f"{header}.{payload}.{forged_signature}")
+    
+    def test_expired_token_is_rejected(self, auth_service):
+        """Test an expired token is rejected by the fast path."""
+        token = auth_service._create_access_token(
+            {"sub": "user-1", "email": "test@example.com"},
+            expires_delta=timedelta(minutes=-1)
+        )
+        
+        with pytest.raises(UnauthorizedError):
+            auth_service.verify_token(token)
+    
+    def test_foreign_header_falls_back_to_jwt_decode(self, auth_service):
+        """Test tokens with a different header are verified by jwt.decode."""
+        token = jwt.encode(
+            {"sub": "user-1", "email": "test@example.com", "exp": 4102444800},
+            services._SECRET_KEY,
+            algorithm="HS256",
+            headers={"kid": "rotated"}
+        )
+        
+        with patch.object(services.jwt, "decode", wraps=jwt.decode) as decode:
+            payload = auth_service.verify_token(token)
+        
+        assert payload["sub"] == "user-1"
+        assert decode.call_count == 1
+
+
+class TestAuthServiceCreateAccessToken:
+    """Test cases for AuthService token issuance."""
+    
+    def test_issued_token_is_standard_jwt(self, auth_service):
+        """Test issued tokens are accepted by a standard JWT implementation."""
+        token = auth_service._create_access_token({"sub": "user-1", "email": "test@example.com"})
+        
+        payload = jwt.decode(token, services._SECRET_KEY, algorithms=["HS256"])
+        
+        assert payload["sub"] == "user-1"
+        assert payload["email"] == "test@example.com"
+        assert isinstance(payload["exp"], int)
+        assert jwt.get_unverified_header(token) == {"alg": "HS256", "typ": "JWT"}
+    
+    def test_issued_token_is_signed_with_current_key(self, auth_service, monkeypatch):
+        """Test a key change is picked up rather than served from the cached key."""
+        auth_service._create_access_token({"sub": "user-1", "email": "test@example.com"})
+        monkeypatch.setattr(services, "_SECRET_KEY", "rotated-secret-key")
+        
+        token = auth_service._create_access_token({"sub": "user-1", "email": "test@example.com"})
+        
+        assert jwt.decode(token, "rotated-secret-key", algorithms=["HS256"])["sub"] == "user-1"
+        with pytest.raises(jwt.JWTError):
+            jwt.decode(token, "test-secret-key", algorithms=["HS256"])
+    
+    def test_expires_at_matches_exp_claim(self, auth_service):
+        """Test the reported expiry is the one encoded in the token."""
+        issued = auth_service._issue_token("user-1", "test@example.com")
+        
+        payload = jwt.decode(issued["access_token"], services._SECRET_KEY, algorithms=["HS256"])
+        
+        assert issued["expires_at"].timestamp() == payload["exp"]
+        assert issued["expires_at"].tzinfo is not None
+
+
+class TestAuthServiceAuthenticateUser:
+    """Test cases for AuthService user authentication."""
+    
+    @pytest.mark.asyncio
+    async def test_unknown_email_still_runs_password_check(self):
+        """Test an unknown email spends the time of a password verification."""
+        user_repository = AsyncMock()
+        user_repository.find_by_email.return_value = None
+        password_service = Mock(spec=PasswordService)
+        service = AuthService(user_repository, password_service)
+        
+        with pytest.raises(UnauthorizedError):
+            await service.authenticate_user("missing@example.com", "TestPassword123")
+        
+        password_service.dummy_verify_async.assert_awaited_once()
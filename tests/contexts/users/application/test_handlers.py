@@ -0,0 +1,94 @@
+import pytest
+from unittest.mock import AsyncMock, Mock
+from src.contexts.users.application.dtos import UserDto
+from src.contexts.users.application.handlers import (
+    user_to_dto, CreateUserCommandHandler, GetUsersQueryHandler
+)
+from src.contexts.users.application.commands import CreateUserCommand
+from src.contexts.users.application.queries import GetUsersQuery
+from src.contexts.users.domain.services import PasswordService
+from src.shared.domain.exceptions import AlreadyExistsError
+
+
+@pytest.fixture
+def create_command(user_payload):
+    """Command creating the sample user."""
+    fields = {key: value for key, value in user_payload.items() if key != "hashed_password"}
+    return CreateUserCommand(password="TestPassword123", **fields)
+
+
+@pytest.fixture
+def password_service(user_payload):
+    """Password service stub that hashes to the sample user's hash."""
+    service = Mock(spec=PasswordService)
+    service.hash_password_async.return_value = user_payload["hashed_password"]
+    return service
+
+
+class TestUserToDto:
+    """Test cases for the User entity to DTO conversion."""
+    
+    def test_sets_every_dto_field(self, user):
+        """Test every UserDto field is set, since construction skips validation."""
+        dto = user_to_dto(user)
+        
+        assert dto.model_fields_set == set(UserDto.model_fields)
+    
+    def test_matches_validated_dto(self, user):
+        """Test the constructed DTO equals a fully validated one."""
+        dto = user_to_dto(user)
+        
+        assert dto == UserDto.model_validate(dto.model_dump())
+        assert dto.email == "test@example.com"
+        assert dto.full_name == "Test User"
+
+
+class TestGetUsersQueryHandler:
+    """Test cases for GetUsersQueryHandler."""
+    
+    @pytest.mark.asyncio
+    async def test_total_comes_from_repository(self, user):
+        """Test the reported total is the repository count, not the page size."""
+        read_repository = AsyncMock()
+        read_repository.find_all_dto.return_value = ([user_to_dto(user)], 42)
+        handler = GetUsersQueryHandler(read_repository)
+        
+        result = await handler.handle(GetUsersQuery(limit=1, offset=5))
+        
+        read_repository.find_all_dto.assert_awaited_once_with(limit=1, offset=5)
+        assert result.total == 42
+        assert [dto.id for dto in result.users] == [user.id]
+
+
+class TestCreateUserCommandHandler:
+    """Test cases for CreateUserCommandHandler."""
+    
+    @pytest.mark.asyncio
+    async def test_publishes_created_event(self, create_command, password_service):
+        """Test the created event is handed to the event bus."""
+        repository = AsyncMock()
+        repository.insert_if_absent.side_effect = lambda user: user
+        event_bus = AsyncMock()
+        handler = CreateUserCommandHandler(repository, password_service, event_bus)
+        
+        result = await handler.handle(create_command)
+        
+        assert result.email == "test@example.com"
+        event_bus.publish.assert_awaited_once()
+        events = event_bus.publish.await_args.args[0]
+        assert [event.event_type for event in events] == ["user_created"]
+    
+    @pytest.mark.asyncio
+    async def test_conflict_reports_duplicate_email(self, create_command, password_service):
+        """Test a rejected insert is reported as the conflicting field."""
+        repository = AsyncMock()
+        repository.insert_if_absent.return_value = None
+        repository.find_conflicting.return_value = "email"
+        event_bus = AsyncMock()
+        handler = CreateUserCommandHandler(repository, password_service, event_bus)
+        
+        with pytest.raises(AlreadyExistsError, match="email"):
+            await handler.handle(create_command)
+        
+        repository.find_conflicting.assert_awaited_once_with("test@example.com", "testuser")
+        event_bus.publish.assert_not_called()
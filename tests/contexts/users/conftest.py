@@ -0,0 +1,72 @@
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from src.contexts.users.domain.entities import User
+from src.contexts.users.domain.services import _PWD_CONTEXT
+from src.contexts.users.infrastructure.adapters import get_event_bus
+from src.shared.application.event_bus import EventBus
+from src.main import app
+
+
+class RecordingEventBus(EventBus):
+    """Event bus that keeps published events instead of sending them."""
+    
+    def __init__(self):
+        self.events = []
+    
+    async def publish(self, events) -> None:
+        self.events.extend(events)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_bcrypt():
+    """Hash with the minimum bcrypt cost while the tests run.
+    
+    The tests check behaviour, not hash strength, and each round doubles the
+    cost of every hash and verify.
+    """
+    original = _PWD_CONTEXT.to_dict()
+    _PWD_CONTEXT.update(bcrypt__rounds=4)
+    yield
+    _PWD_CONTEXT.load(original)
+
+
+@pytest.fixture(autouse=True)
+def event_bus():
+    """Record the events the app publishes instead of sending them to RabbitMQ."""
+    bus = RecordingEventBus()
+    app.dependency_overrides[get_event_bus] = lambda: bus
+    yield bus
+    app.dependency_overrides.pop(get_event_bus, None)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """In-process async client for the app, following redirects like TestClient.
+    
+    Built once for the session on the shared session event loop. Tests that
+    touch the database also take db_session, whose function-scoped override
+    of get_db points the app at that test's rolled-back session.
+    """
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://testserver", follow_redirects=True
+    ) as client:
+        yield client
+
+
+@pytest.fixture
+def user_payload():
+    """Arguments for User.create describing a valid sample user."""
+    return {
+        "email": "test@example.com",
+        "username": "testuser",
+        "first_name": "Test",
+        "last_name": "User",
+        "hashed_password": "$2b$12$hashed_value"
+    }
+
+
+@pytest.fixture
+def user(user_payload):
+    """A freshly created sample user, still holding its UserCreated event."""
+    return User.create(**user_payload)
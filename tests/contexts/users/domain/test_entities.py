@@ -1,3 +1,5 @@
+import uuid
+from datetime import datetime, timezone
 import pytest
 from src.contexts.users.domain.entities import User, UserCreated, UserUpdated
 from src.contexts.users.domain.value_objects import Email, Username, FullName, HashedPassword
@@ -6,16 +8,8 @@ from src.contexts.users.domain.value_objects import Email, Username, FullName, H
 class TestUser:
     """Test cases for User entity."""
     
-    def test_create_user_factory_method(self):
+    def test_create_user_factory_method(self, user):
         """Test creating user using factory method."""
-        user = User.create(
-            email="test@example.com",
-            username="testuser",
-            first_name="Test",
-            last_name="User",
-            hashed_password="$2b$12$hashed_value"
-        )
-        
         assert user.email.value == "test@example.com"
         assert user.username.value == "testuser"
         assert user.full_name.first_name == "Test"
@@ -27,16 +21,8 @@ class TestUser:
         assert user.created_at is not None
         assert user.updated_at is not None
     
-    def test_create_user_generates_domain_event(self):
+    def test_create_user_generates_domain_event(self, user):
         """Test creating user generates UserCreated domain event."""
-        user = User.create(
-            email="test@example.com",
-            username="testuser",
-            first_name="Test",
-            last_name="User",
-            hashed_password="$2b$12$hashed_value"
-        )
-        
         events = user.get_domain_events()
         assert len(events) == 1
         assert isinstance(events[0], UserCreated)
@@ -45,16 +31,24 @@ class TestUser:
         assert events[0].data["email"] == "test@example.com"
         assert events[0].data["username"] == "testuser"
     
-    def test_update_profile(self):
-        """Test updating user profile."""
-        user = User.create(
-            email="test@example.com",
-            username="testuser",
-            first_name="Test",
-            last_name="User",
-            hashed_password="$2b$12$hashed_value"
-        )
+    def test_create_user_shares_timestamp_with_event(self, user_payload):
+        """Test the entity and its creation event share a single timestamp."""
+        now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        user = User.create(**user_payload, now=now)
+        
+        assert user.created_at == now
+        assert user.updated_at == now
+        assert user.get_domain_events()[0].occurred_at == now
+    
+    def test_generated_ids_are_unique_uuid4(self):
+        """Test buffered ids are distinct version 4 UUIDs."""
+        ids = [User().id for _ in range(600)]
         
+        assert len(set(ids)) == len(ids)
+        assert all(uuid.UUID(user_id).version == 4 for user_id in ids)
+    
+    def test_update_profile(self, user):
+        """Test updating user profile."""
         # Clear initial events
         user.clear_domain_events()
         
@@ -72,16 +66,8 @@ class TestUser:
         assert events[0].data["user_id"] == user.id
         assert "full_name" in events[0].data["changes"]
     
-    def test_update_profile_partial(self):
+    def test_update_profile_partial(self, user):
         """Test updating user profile partially."""
-        user = User.create(
-            email="test@example.com",
-            username="testuser",
-            first_name="Test",
-            last_name="User",
-            hashed_password="$2b$12$hashed_value"
-        )
-        
         user.clear_domain_events()
         
         user.update_profile(first_name="Updated")
@@ -89,16 +75,8 @@ class TestUser:
         assert user.full_name.first_name == "Updated"
         assert user.full_name.last_name == "User"  # Should remain unchanged
     
-    def test_deactivate_user(self):
+    def test_deactivate_user(self, user):
         """Test deactivating user."""
-        user = User.create(
-            email="test@example.com",
-            username="testuser",
-            first_name="Test",
-            last_name="User",
-            hashed_password="$2b$12$hashed_value"
-        )
-        
         user.clear_domain_events()
         
         user.deactivate()
@@ -111,16 +89,8 @@ class TestUser:
         assert isinstance(events[0], UserUpdated)
         assert events[0].data["changes"]["is_active"] is False
     
-    def test_activate_user(self):
+    def test_activate_user(self, user):
         """Test activating user."""
-        user = User.create(
-            email="test@example.com",
-            username="testuser",
-            first_name="Test",
-            last_name="User",
-            hashed_password="$2b$12$hashed_value"
-        )
-        
         user.deactivate()
         user.clear_domain_events()
         
@@ -158,30 +128,15 @@ class TestUser:
         assert user1 != user2  # Different IDs
         assert user1 == user3   # Same ID
     
-    def test_user_hash(self):
+    def test_user_hash(self, user):
         """Test user hash method."""
-        user1 = User.create(
-            email="test@example.com",
-            username="testuser",
-            first_name="Test",
-            last_name="User",
-            hashed_password="$2b$12$hashed_value"
-        )
-        
+        user1 = user
         user2 = User(user_id=user1.id)
         
         assert hash(user1) == hash(user2)  # Same ID should have same hash
     
-    def test_clear_domain_events(self):
+    def test_clear_domain_events(self, user):
         """Test clearing domain events."""
-        user = User.create(
-            email="test@example.com",
-            username="testuser",
-            first_name="Test",
-            last_name="User",
-            hashed_password="$2b$12$hashed_value"
-        )
-        
         assert len(user.get_domain_events()) == 1
         
         user.clear_domain_events()
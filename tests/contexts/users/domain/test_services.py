@@ -3,39 +3,88 @@ from src.contexts.users.domain.services import PasswordService
 from src.shared.domain.exceptions import ValidationError
 
 
+VALID_PASSWORDS = [
+    "TestPassword123",
+    "MySecurePassword1",
+    "ValidPass123",
+    "StrongPassword2024"
+]
+
+INVALID_PASSWORDS = [
+    "short",                    # Too short
+    "testpassword123",         # No uppercase
+    "TESTPASSWORD123",         # No lowercase
+    "TestPassword",            # No digit
+    "",                        # Empty
+    "NoDigits"                 # No digits
+]
+
+
 class TestPasswordService:
     """Test cases for PasswordService."""
     
-    def test_hash_valid_password(self):
+    def test_hash_valid_password(self, sample_hashes):
         """Test hashing a valid password."""
-        service = PasswordService()
         password = "TestPassword123"
         
-        hashed = service.hash_password(password)
+        hashed = sample_hashes[password]
         
         assert hashed is not None
         assert hashed != password
         assert hashed.startswith("$2b$")
     
-    def test_verify_correct_password(self):
+    def test_verify_correct_password(self, sample_hashes):
         """Test verifying correct password."""
         service = PasswordService()
         password = "TestPassword123"
         
-        hashed = service.hash_password(password)
+        hashed = sample_hashes[password]
         
         assert service.verify_password(password, hashed) is True
     
-    def test_verify_incorrect_password(self):
+    def test_verify_incorrect_password(self, sample_hashes):
         """Test verifying incorrect password."""
         service = PasswordService()
         password = "TestPassword123"
         wrong_password = "WrongPassword123"
         
-        hashed = service.hash_password(password)
+        hashed = sample_hashes[password]
         
         assert service.verify_password(wrong_password, hashed) is False
     
+    def test_verify_against_malformed_hash(self):
+        """Test verifying against a hash that cannot be parsed fails instead of raising."""
+        service = PasswordService()
+        
+        assert service.verify_password("TestPassword123", "not-a-bcrypt-hash") is False
+        assert service.verify_password("TestPassword123", "$2b$12$short") is False
+    
+    def test_dummy_verify(self):
+        """Test dummy verification never succeeds."""
+        service = PasswordService()
+        
+        assert service.dummy_verify() is False
+    
+    @pytest.mark.asyncio
+    async def test_hash_and_verify_password_async(self):
+        """Test the async variants hash and verify like the sync ones."""
+        service = PasswordService()
+        password = "TestPassword123"
+        
+        hashed = await service.hash_password_async(password)
+        
+        assert hashed.startswith("$2b$")
+        assert await service.verify_password_async(password, hashed) is True
+        assert await service.verify_password_async("WrongPassword123", hashed) is False
+    
+    @pytest.mark.asyncio
+    async def test_hash_password_async_validates(self):
+        """Test the async variant rejects invalid passwords."""
+        service = PasswordService()
+        
+        with pytest.raises(ValidationError):
+            await service.hash_password_async("short")
+    
     def test_hash_password_too_short(self):
         """Test hashing password that's too short raises ValidationError."""
         service = PasswordService()
@@ -71,34 +120,17 @@ class TestPasswordService:
         with pytest.raises(ValidationError):
             service.hash_password("")
     
-    def test_password_validation_requirements(self):
-        """Test various password validation scenarios."""
+    @pytest.mark.parametrize("password", VALID_PASSWORDS)
+    def test_valid_password_requirements(self, password):
+        """Test passwords meeting every requirement are accepted."""
+        service = PasswordService()
+        
+        service.validate_password(password)
+    
+    @pytest.mark.parametrize("password", INVALID_PASSWORDS)
+    def test_invalid_password_requirements(self, password):
+        """Test passwords missing a requirement raise ValidationError."""
         service = PasswordService()
         
-        # Valid passwords
-        valid_passwords = [
-            "TestPassword123",
-            "MySecurePassword1",
-            "ValidPass123",
-            "StrongPassword2024"
-        ]
-        
-        for password in valid_passwords:
-            try:
-                service.hash_password(password)
-            except ValidationError:
-                pytest.fail(f"Password '{password}' should be valid")
-        
-        # Invalid passwords
-        invalid_passwords = [
-            "short",                    # Too short
-            "testpassword123",         # No uppercase
-            "TESTPASSWORD123",         # No lowercase
-            "TestPassword",            # No digit
-            "",                        # Empty
-            "NoDigits"                 # No digits
-        ]
-        
-        for password in invalid_passwords:
-            with pytest.raises(ValidationError):
-                service.hash_password(password) 
\ No newline at end of file
+        with pytest.raises(ValidationError):
+            service.hash_password(password)
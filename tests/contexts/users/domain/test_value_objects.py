@@ -65,6 +65,11 @@ class TestEmail:
         with pytest.raises(ValidationError):
             Email("@example.com")
     
+    def test_email_with_trailing_newline(self):
+        """Test an email followed by a newline is rejected."""
+        with pytest.raises(ValidationError):
+            Email("test@example.com\n")
+    
     def test_email_equality(self):
         """Test email equality comparison."""
         email1 = Email("test@example.com")
@@ -73,6 +78,10 @@ class TestEmail:
         
         assert email1 == email2
         assert email1 != email3
+    
+    def test_from_trusted(self):
+        """Test a trusted email equals one built with validation."""
+        assert Email.from_trusted("test@example.com") == Email("test@example.com")
 
 
 class TestUsername:
@@ -103,6 +112,9 @@ class TestUsername:
         
         with pytest.raises(ValidationError):
             Username("test@user")
+        
+        with pytest.raises(ValidationError):
+            Username("testuser\n")
     
     def test_username_equality(self):
         """Test username equality comparison."""
@@ -112,6 +124,10 @@ class TestUsername:
         
         assert username1 == username2
         assert username1 != username3
+    
+    def test_from_trusted(self):
+        """Test a trusted username equals one built with validation."""
+        assert Username.from_trusted("testuser123") == Username("testuser123")
 
 
 class TestFullName:
@@ -154,6 +170,10 @@ class TestFullName:
         
         assert name1 == name2
         assert name1 != name3
+    
+    def test_from_trusted(self):
+        """Test a trusted full name equals one built with validation."""
+        assert FullName.from_trusted("John", "Doe") == FullName("John", "Doe")
 
 
 class TestHashedPassword:
@@ -176,4 +196,8 @@ class TestHashedPassword:
         password3 = HashedPassword("$2b$12$other_value")
         
         assert password1 == password2
-        assert password1 != password3 
\ No newline at end of file
+        assert password1 != password3
+    
+    def test_from_trusted(self):
+        """Test a trusted hashed password equals one built with validation."""
+        assert HashedPassword.from_trusted("$2b$12$hash") == HashedPassword("$2b$12$hash")
@@ -1,15 +1,14 @@
+import asyncio
+import time
 import pytest
-from fastapi.testclient import TestClient
-from src.main import app
-
-
-client = TestClient(app)
+from src.contexts.auth.domain import services as auth_services
 
 
 class TestAuthIntegration:
     """Test integration between auth and user endpoints."""
     
-    def test_create_user_public_endpoint(self, db_session):
+    @pytest.mark.asyncio
+    async def test_create_user_public_endpoint(self, client, db_session):
         """Test that user creation doesn't require authentication."""
         user_data = {
             "email": "test@example.com",
@@ -19,15 +18,16 @@ class TestAuthIntegration:
             "password": "TestPassword123!"
         }
         
-        response = client.post("/api/v1/users", json=user_data)
-        assert response.status_code == 200
+        response = await client.post("/api/v1/users", json=user_data)
+        assert response.status_code == 201
         
         data = response.json()
         assert data["email"] == user_data["email"]
         assert data["username"] == user_data["username"]
         assert "id" in data
     
-    def test_protected_endpoints_require_auth(self, db_session):
+    @pytest.mark.asyncio
+    async def test_protected_endpoints_require_auth(self, client, db_session):
         """Test that protected endpoints require JWT token."""
         # Try to access protected endpoints without token
         endpoints = [
@@ -37,11 +37,13 @@ class TestAuthIntegration:
             ("DELETE", "/api/v1/users/some-id")
         ]
         
-        for method, endpoint in endpoints:
-            response = client.request(method, endpoint)
+        responses = await asyncio.gather(*(client.request(method, endpoint) for method, endpoint in endpoints))
+        
+        for response in responses:
             assert response.status_code == 403  # Forbidden without auth
     
-    def test_full_auth_flow(self, db_session):
+    @pytest.mark.asyncio
+    async def test_full_auth_flow(self, client, db_session, monkeypatch):
         """Test complete authentication flow."""
         # 1. Create user
         user_data = {
@@ -52,8 +54,8 @@ class TestAuthIntegration:
             "password": "AuthPassword123!"
         }
         
-        response = client.post("/api/v1/users", json=user_data)
-        assert response.status_code == 200
+        response = await client.post("/api/v1/users", json=user_data)
+        assert response.status_code == 201
         user = response.json()
         user_id = user["id"]
         
@@ -63,7 +65,7 @@ class TestAuthIntegration:
             "password": user_data["password"]
         }
         
-        response = client.post("/api/v1/auth/login", json=login_data)
+        response = await client.post("/api/v1/auth/login", json=login_data)
         assert response.status_code == 200
         
         auth_data = response.json()
@@ -73,21 +75,24 @@ class TestAuthIntegration:
         # 3. Use token to access protected endpoints
         headers = {"Authorization": f"Bearer {token}"}
         
-        # Get user
-        response = client.get(f"/api/v1/users/{user_id}", headers=headers)
+        # Get user and list users one after the other: both requests share the
+        # test's AsyncSession, which must not be used concurrently
+        response = await client.get(f"/api/v1/users/{user_id}", headers=headers)
         assert response.status_code == 200
         
-        # List users
-        response = client.get("/api/v1/users", headers=headers)
+        response = await client.get("/api/v1/users", headers=headers)
         assert response.status_code == 200
         
         # Update user
         update_data = {"first_name": "Updated", "last_name": "Name"}
-        response = client.put(f"/api/v1/users/{user_id}", json=update_data, headers=headers)
+        response = await client.put(f"/api/v1/users/{user_id}", json=update_data, headers=headers)
         assert response.status_code == 200
         
-        # Refresh token
-        response = client.post("/api/v1/auth/refresh", headers=headers)
+        # Refresh token; expiry has one-second resolution, so move the clock on
+        # or a refresh within the same second reissues the identical token
+        later = time.time() + 1
+        monkeypatch.setattr(auth_services.time, "time", lambda: later)
+        response = await client.post("/api/v1/auth/refresh", headers=headers)
         assert response.status_code == 200
         refresh_data = response.json()
         assert "access_token" in refresh_data
@@ -95,29 +100,32 @@ class TestAuthIntegration:
         assert new_token != token  # Token should be different
         
         # Delete user
-        response = client.delete(f"/api/v1/users/{user_id}", headers=headers)
+        response = await client.delete(f"/api/v1/users/{user_id}", headers=headers)
         assert response.status_code == 204  # No content
     
-    def test_invalid_token_access(self, db_session):
+    @pytest.mark.asyncio
+    async def test_invalid_token_access(self, client, db_session):
         """Test that invalid tokens are rejected."""
         headers = {"Authorization": "Bearer invalid-token"}
         
-        response = client.get("/api/v1/users", headers=headers)
+        response = await client.get("/api/v1/users", headers=headers)
         assert response.status_code == 401  # Unauthorized
         
         response_data = response.json()
         assert "Invalid authentication credentials" in response_data["detail"]
     
-    def test_expired_token_refresh(self, db_session):
+    @pytest.mark.asyncio
+    async def test_expired_token_refresh(self, client, db_session):
         """Test refreshing an expired token."""
         # This would require mocking time or using a very short expiration
         # For now, test with a malformed token
         headers = {"Authorization": "Bearer expired.token.here"}
         
-        response = client.post("/api/v1/auth/refresh", headers=headers)
+        response = await client.post("/api/v1/auth/refresh", headers=headers)
         assert response.status_code == 401
     
-    def test_verify_token_endpoint(self, db_session):
+    @pytest.mark.asyncio
+    async def test_verify_token_endpoint(self, client, db_session):
         """Test token verification endpoint."""
         # Create user and login to get valid token
         user_data = {
@@ -128,9 +136,9 @@ class TestAuthIntegration:
             "password": "VerifyPassword123!"
         }
         
-        client.post("/api/v1/users", json=user_data)
+        await client.post("/api/v1/users", json=user_data)
         
-        login_response = client.post("/api/v1/auth/login", json={
+        login_response = await client.post("/api/v1/auth/login", json={
             "email": user_data["email"],
             "password": user_data["password"]
         })
@@ -138,7 +146,7 @@ class TestAuthIntegration:
         
         # Verify valid token
         headers = {"Authorization": f"Bearer {token}"}
-        response = client.post("/api/v1/auth/verify", headers=headers)
+        response = await client.post("/api/v1/auth/verify", headers=headers)
         assert response.status_code == 200
         
         verify_data = response.json()
@@ -148,5 +156,5 @@ class TestAuthIntegration:
         
         # Verify invalid token
         headers = {"Authorization": "Bearer invalid-token"}
-        response = client.post("/api/v1/auth/verify", headers=headers)
+        response = await client.post("/api/v1/auth/verify", headers=headers)
         assert response.status_code == 401 
\ No newline at end of file